@@ -9,6 +9,7 @@ from gohumanloop.core.interface import (
 
 from gohumanloop.core.manager import DefaultHumanLoopManager
 from gohumanloop.manager.ghl_manager import GoHumanLoopManager
+from gohumanloop.manager.batching_manager import BatchingHumanLoopManager
 
 from gohumanloop.providers.ghl_provider import GoHumanLoopProvider
 from gohumanloop.providers.api_provider import APIProvider
@@ -57,6 +58,7 @@ __all__ = [
     # Manager Implementations
     "DefaultHumanLoopManager",
     "GoHumanLoopManager",
+    "BatchingHumanLoopManager",
     # Provider Implementations
     "BaseProvider",
     "APIProvider",
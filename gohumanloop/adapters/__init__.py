@@ -1,6 +1,7 @@
 from .base_adapter import (
     HumanloopAdapter,
     AgentOpsHumanLoopCallback,
+    get_active_state,
 )
 from .langgraph_adapter import (
     LangGraphHumanLoopCallback,
@@ -13,6 +14,7 @@ from .langgraph_adapter import (
 __all__ = [
     "HumanloopAdapter",
     "AgentOpsHumanLoopCallback",
+    "get_active_state",
     "LangGraphHumanLoopCallback",
     "default_langgraph_callback_factory",
     "interrupt",
@@ -8,18 +8,28 @@ from typing import (
     TypeVar,
     Union,
     Type,
+    Tuple,
     AsyncIterator,
     Iterator,
     Coroutine,
 )
 from types import TracebackType
+from contextvars import ContextVar
 from functools import wraps
-import uuid
+import itertools
+import os
+import time
+import inspect
 from inspect import iscoroutinefunction
 from contextlib import asynccontextmanager, contextmanager
 import logging
+import weakref
 
-from gohumanloop.utils import run_async_safely, generate_function_summary
+from gohumanloop.utils import (
+    BackgroundEventLoop,
+    run_async_safely,
+    make_function_summary,
+)
 from gohumanloop.core.interface import (
     HumanLoopRequest,
     HumanLoopResult,
@@ -36,8 +46,71 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T")
 R = TypeVar("R", bound=Union[Any, None])
 
+# Default task/conversation ids only need to be unique within this process
+_ID_PREFIX = f"{os.getpid()}-{time.time_ns():x}-"
+_next_id = itertools.count().__next__
+
+
+# State (first positional argument) of the decorated call whose human loop is running
+_ACTIVE_STATE: ContextVar[Any] = ContextVar("gohumanloop_state", default=None)
+
+
+def get_active_state() -> Any:
+    """Get the state of the decorated call whose human loop is currently running
+
+    Lets pre-built callback instances read the per-call state instead of
+    being created by a factory on every call.
+    """
+    return _ACTIVE_STATE.get()
+
+
+def _new_id() -> str:
+    """Cheap process-unique id for omitted task_id/conversation_id"""
+    return _ID_PREFIX + format(_next_id(), "x")
+
+
+def _accepts_kwarg(fn: Callable, name: str) -> bool:
+    """Check whether fn can receive the keyword argument `name`"""
+    params = inspect.signature(fn).parameters
+    return name in params or any(
+        p.kind is inspect.Parameter.VAR_KEYWORD for p in params.values()
+    )
+
+
+def _static_function_info(fn: Callable) -> Tuple[str, str, str]:
+    """Name, signature and doc strings sent with every request for fn"""
+    return (
+        fn.__name__,
+        str(fn.__code__.co_varnames),
+        fn.__doc__ or "No documentation available",
+    )
+
+
+_CONVERSATION_QUESTION_PREFIX = "Please respond to the following information:\n"
+_CONVERSATION_QUESTION_EMPTY = _CONVERSATION_QUESTION_PREFIX + "{}"
+
+
+def _constant_question(text: str) -> Callable[[Tuple[Any, ...], Dict[str, Any]], str]:
+    """Question builder that always returns the same text"""
+    return lambda args, kwargs: text
+
+
+def _split_callback(
+    callback: Optional[Union[HumanLoopCallback, Callable[[Any], HumanLoopCallback]]],
+) -> Tuple[Optional[Callable[[Any], HumanLoopCallback]], Optional[HumanLoopCallback]]:
+    """Split callback into (factory, instance) once at decoration time"""
+    # A callback class is itself a factory; the protocol check alone would
+    # mistake the class object for an instance
+    if isinstance(callback, type) or (
+        callable(callback) and not isinstance(callback, HumanLoopCallback)
+    ):
+        return callback, None
+    return None, cast(Optional[HumanLoopCallback], callback)
+
 
 class HumanLoopWrapper:
+    __slots__ = ("decorator",)
+
     def __init__(
         self,
         decorator: Callable[[Any], Callable],
@@ -65,6 +138,11 @@ class HumanloopAdapter:
     ):
         self.manager = manager
         self.default_timeout = default_timeout
+        # Started lazily on the first sync call, shared by all sync wrappers.
+        # Stopped when the adapter is collected, so temporary adapters
+        # (``HumanloopAdapter(manager).require_info()``) don't leak threads
+        self._bg_loop = BackgroundEventLoop(name="ghl-adapter-loop")
+        weakref.finalize(self, self._bg_loop.close)
 
     async def __aenter__(self) -> "HumanloopAdapter":
         """Implements async context manager protocol, automatically manages manager lifecycle"""
@@ -107,9 +185,23 @@ class HumanloopAdapter:
         manager = cast(Any, self.manager)
         if hasattr(manager, "__exit__"):
             manager.__exit__(exc_type, exc_val, exc_tb)
+        self._bg_loop.close()
 
         return None
 
+    def _run_sync(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        """Run a wrapper coroutine from a sync decorated function
+
+        Managers declaring ``supports_sync`` are driven on the adapter's
+        background loop, skipping per-call event loop setup; others use
+        run_async_safely. Only managers whose state is safe to use from that
+        thread while async callers use it on their own loop should declare
+        it; DefaultHumanLoopManager does not.
+        """
+        if getattr(self.manager, "supports_sync", False):
+            return self._bg_loop.run(coro)
+        return run_async_safely(coro)
+
     @asynccontextmanager
     async def asession(self) -> AsyncIterator["HumanloopAdapter"]:
         """Provides async context manager for managing session lifecycle
@@ -143,6 +235,124 @@ class HumanloopAdapter:
         finally:
             if hasattr(manager, "__exit__"):
                 manager.__exit__(None, None, None)
+            self._bg_loop.close()
+
+    def _build_humanloop_wrapper(
+        self,
+        fn: Callable[[T], R],
+        task_id: str,
+        conversation_id: str,
+        *,
+        loop_type: HumanLoopType,
+        question: Callable[[Tuple[Any, ...], Dict[str, Any]], str],
+        check_result: Callable[[Union[str, HumanLoopResult]], None],
+        ret_key: str,
+        ret_key_required: bool,
+        additional: Optional[str] = "",
+        metadata: Optional[Dict[str, Any]] = None,
+        provider_id: Optional[str] = None,
+        timeout: Optional[int] = None,
+        callback: Optional[
+            Union[HumanLoopCallback, Callable[[Any], HumanLoopCallback]]
+        ] = None,
+        upsert: bool = False,
+    ) -> Union[
+        Callable[[T], Coroutine[Any, Any, R]],  # For async functions
+        Callable[[T], R],  # For sync functions
+    ]:
+        """Shared wrapper builder behind the approval, info and conversation decorators
+
+        - question: builds the question shown to the human from (args, kwargs)
+        - check_result: raises if fn must not run for the given result
+        - ret_key_required: raise on call if fn cannot receive ret_key,
+          otherwise the result is only injected when fn can receive it
+        - upsert: continue the conversation if it already exists, otherwise
+          start it with the function block as the first turn's message
+        """
+
+        ret_key_available = _accepts_kwarg(fn, ret_key)
+        # Static part of the function summary is fixed at decoration time
+        summarize = make_function_summary(fn)
+        fn_name, fn_signature, fn_doc = _static_function_info(fn)
+        is_coro = iscoroutinefunction(fn)
+        # Determine if callback is instance or factory function
+        callback_factory, callback_instance = _split_callback(callback)
+
+        async def humanloop(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> None:
+            # Check if ret_key exists in function parameters
+            if ret_key_required and not ret_key_available:
+                raise ValueError(
+                    f"Function {fn.__name__} must have parameter named {ret_key}"
+                )
+
+            # state is the first argument, None if args is empty
+            state = args[0] if args else None
+            cb = callback_instance
+            if callback_factory is not None:
+                cb = callback_factory(state)
+
+            function_info = {
+                "function_name": fn_name,
+                "function_signature": fn_signature,
+                "arguments": str(args),
+                "keyword_arguments": str(kwargs),
+                "documentation": fn_doc,
+            }
+            question_content = question(args, kwargs)
+            context: Dict[str, Any] = {
+                "message": summarize(args, kwargs),
+                "function": function_info,
+                "question": question_content,
+                "additional": additional,
+            }
+            request = self.manager.async_request_humanloop
+            extra: Dict[str, Any] = {}
+            if upsert:
+                request = self.manager.async_upsert_humanloop
+                # The first turn of a conversation carries the function block as its message
+                extra["initial_context"] = {
+                    "message": function_info,
+                    "question": question_content,
+                    "additional": additional,
+                }
+            token = _ACTIVE_STATE.set(state)
+            try:
+                result = await request(
+                    task_id=task_id,
+                    conversation_id=conversation_id,
+                    loop_type=loop_type,
+                    context=context,
+                    callback=cb,
+                    metadata=metadata,
+                    provider_id=provider_id,
+                    timeout=timeout or self.default_timeout,
+                    blocking=True,
+                    **extra,
+                )
+            finally:
+                _ACTIVE_STATE.reset(token)
+
+            if ret_key_available and isinstance(result, HumanLoopResult):
+                # Inject complete result info into kwargs
+                kwargs[ret_key] = result.as_dict()
+
+            check_result(result)
+
+        @wraps(fn)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> R:
+            await humanloop(args, kwargs)
+            return await cast(Coroutine[Any, Any, R], fn(*args, **kwargs))
+
+        @wraps(fn)
+        def sync_wrapper(*args: Any, **kwargs: Any) -> R:
+            # Only the human loop goes through the event loop, fn runs in this thread
+            self._run_sync(humanloop(args, kwargs))
+            return fn(*args, **kwargs)
+
+        # Return corresponding wrapper based on decorated function type
+        if is_coro:
+            return async_wrapper
+        return sync_wrapper
 
     def require_approval(
         self,
@@ -160,9 +370,9 @@ class HumanloopAdapter:
     ) -> HumanLoopWrapper:
         """Decorator for approval scenario"""
         if task_id is None:
-            task_id = str(uuid.uuid4())
+            task_id = _new_id()
         if conversation_id is None:
-            conversation_id = str(uuid.uuid4())
+            conversation_id = _new_id()
 
         def decorator(fn: Callable) -> Callable:
             return self._approve_cli(
@@ -239,88 +449,16 @@ class HumanloopAdapter:
             - error: Error information if any
         """
 
-        @wraps(fn)
-        async def async_wrapper(*args: Any, **kwargs: Any) -> R:
-            # Note: ret_key parameter is optional for approval functions
-            # If ret_key is not present in the function signature,
-            # approval information will not be passed to the function
-            # Check if ret_key exists in function parameters
-            if ret_key in fn.__code__.co_varnames:
-                # Only inject approval info if ret_key parameter exists
-                approval_info_available = True
-            else:
-                approval_info_available = False
-
-            # Determine if callback is instance or factory function
-            cb = None
-            if callable(callback) and not isinstance(callback, HumanLoopCallback):
-                # Factory function, pass state
-                state = args[0] if args else None
-                cb = callback(state)
-            else:
-                cb = callback
-
-            result = await self.manager.async_request_humanloop(
-                task_id=task_id,
-                conversation_id=conversation_id,
-                loop_type=HumanLoopType.APPROVAL,
-                context={
-                    "message": generate_function_summary(fn, args, kwargs),
-                    "function": {
-                        "function_name": fn.__name__,
-                        "function_signature": str(fn.__code__.co_varnames),
-                        "arguments": str(args),
-                        "keyword_arguments": str(kwargs),
-                        "documentation": fn.__doc__ or "No documentation available",
-                    },
-                    "question": "Please review and approve/reject this human loop execution.",
-                    "additional": additional,
-                },
-                callback=cb,
-                metadata=metadata,
-                provider_id=provider_id,
-                timeout=timeout or self.default_timeout,
-                blocking=True,
-            )
-
-            if approval_info_available:
-                # Initialize approval result object as None
-                approval_info = None
-
-                if isinstance(result, HumanLoopResult):
-                    # If result is HumanLoopResult type, build complete approval info
-                    approval_info = {
-                        "conversation_id": result.conversation_id,
-                        "request_id": result.request_id,
-                        "loop_type": result.loop_type,
-                        "status": result.status,
-                        "response": result.response,
-                        "feedback": result.feedback,
-                        "responded_by": result.responded_by,
-                        "responded_at": result.responded_at,
-                        "error": result.error,
-                    }
-
-                    # Inject approval info into kwargs
-                    kwargs[ret_key] = approval_info
-
+        def check_result(result: Union[str, HumanLoopResult]) -> None:
             # Check approval result
             if isinstance(result, HumanLoopResult):
                 # Handle based on approval status
                 if result.status == HumanLoopStatus.APPROVED:
-                    if iscoroutinefunction(fn):
-                        ret = await fn(*args, **kwargs)
-                    else:
-                        ret = fn(*args, **kwargs)
-                    return cast(R, ret)
+                    return
                 elif result.status == HumanLoopStatus.REJECTED:
                     # If execute on reject is set, run the function
                     if execute_on_reject:
-                        if iscoroutinefunction(fn):
-                            ret = await fn(*args, **kwargs)
-                        else:
-                            ret = fn(*args, **kwargs)
-                        return cast(R, ret)
+                        return
                     # Otherwise return rejection info
                     reason = result.response
                     raise ValueError(
@@ -333,15 +471,24 @@ class HumanloopAdapter:
             else:
                 raise ValueError(f"Unknown approval error: {fn.__name__}")
 
-        @wraps(fn)
-        def sync_wrapper(*args: Any, **kwargs: Any) -> R:
-            ret = run_async_safely(async_wrapper(*args, **kwargs))
-            return cast(R, ret)
-
-        # Return corresponding wrapper based on decorated function type
-        if iscoroutinefunction(fn):
-            return async_wrapper
-        return sync_wrapper
+        # Note: ret_key parameter is optional for approval functions
+        return self._build_humanloop_wrapper(
+            fn,
+            task_id,
+            conversation_id,
+            loop_type=HumanLoopType.APPROVAL,
+            question=_constant_question(
+                "Please review and approve/reject this human loop execution."
+            ),
+            check_result=check_result,
+            ret_key=ret_key,
+            ret_key_required=False,
+            additional=additional,
+            metadata=metadata,
+            provider_id=provider_id,
+            timeout=timeout,
+            callback=callback,
+        )
 
     def require_conversation(
         self,
@@ -360,9 +507,9 @@ class HumanloopAdapter:
         """Decorator for multi-turn conversation scenario"""
 
         if task_id is None:
-            task_id = str(uuid.uuid4())
+            task_id = _new_id()
         if conversation_id is None:
-            conversation_id = str(uuid.uuid4())
+            conversation_id = _new_id()
 
         def decorator(fn: Callable) -> Callable:
             return self._conversation_cli(
@@ -438,127 +585,44 @@ class HumanloopAdapter:
         - Automatically adapts to async and sync functions
         """
 
-        @wraps(fn)
-        async def async_wrapper(*args: Any, **kwargs: Any) -> R:
-            # Check if ret_key exists in function parameters
-            if ret_key not in fn.__code__.co_varnames:
-                raise ValueError(
-                    f"Function {fn.__name__} must have parameter named {ret_key}"
-                )
-
-            # Determine if callback is instance or factory function
-            cb = None
+        def question(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> str:
             state = args[0] if args else None
-            if callable(callback) and not isinstance(callback, HumanLoopCallback):
-                cb = callback(state)
-            else:
-                cb = callback
 
             # First try to get node_input from kwargs using state_key
             node_input = kwargs.get(state_key)
 
             # If not found in kwargs, try to get from first argument (state)
             if node_input is None and state and isinstance(state, dict):
-                node_input = state.get(state_key, {})
+                node_input = state.get(state_key)
 
-            # If still not found, use empty dict as default
+            # If still not found, show an empty dict without allocating one
             if node_input is None:
-                node_input = {}
-
-            # Compose question content
-            question_content = (
-                f"Please respond to the following information:\n{node_input}"
-            )
-
-            # Check if conversation exists to determine whether to use request_humanloop or continue_humanloop
-            conversation_requests = await self.manager.async_check_conversation_exist(
-                task_id, conversation_id
-            )
-
-            result = None
-            if conversation_requests:
-                # Existing conversation, use continue_humanloop
-                result = await self.manager.async_continue_humanloop(
-                    conversation_id=conversation_id,
-                    context={
-                        "message": generate_function_summary(fn, args, kwargs),
-                        "function": {
-                            "function_name": fn.__name__,
-                            "function_signature": str(fn.__code__.co_varnames),
-                            "arguments": str(args),
-                            "keyword_arguments": str(kwargs),
-                            "documentation": fn.__doc__ or "No documentation available",
-                        },
-                        "question": question_content,
-                        "additional": additional,
-                    },
-                    timeout=timeout or self.default_timeout,
-                    callback=cb,
-                    metadata=metadata,
-                    provider_id=provider_id,
-                    blocking=True,
-                )
-            else:
-                # New conversation, use request_humanloop
-                result = await self.manager.async_request_humanloop(
-                    task_id=task_id,
-                    conversation_id=conversation_id,
-                    loop_type=HumanLoopType.CONVERSATION,
-                    context={
-                        "message": {
-                            "function_name": fn.__name__,
-                            "function_signature": str(fn.__code__.co_varnames),
-                            "arguments": str(args),
-                            "keyword_arguments": str(kwargs),
-                            "documentation": fn.__doc__ or "No documentation available",
-                        },
-                        "question": question_content,
-                        "additional": additional,
-                    },
-                    timeout=timeout or self.default_timeout,
-                    callback=cb,
-                    metadata=metadata,
-                    provider_id=provider_id,
-                    blocking=True,
-                )
-
-            # Initialize conversation result object as None
-            conversation_info = None
+                return _CONVERSATION_QUESTION_EMPTY
+            return _CONVERSATION_QUESTION_PREFIX + str(node_input)
 
-            if isinstance(result, HumanLoopResult):
-                conversation_info = {
-                    "conversation_id": result.conversation_id,
-                    "request_id": result.request_id,
-                    "loop_type": result.loop_type,
-                    "status": result.status,
-                    "response": result.response,
-                    "feedback": result.feedback,
-                    "responded_by": result.responded_by,
-                    "responded_at": result.responded_at,
-                    "error": result.error,
-                }
-                # Inject conversation info into kwargs
-                kwargs[ret_key] = conversation_info
-
-            if isinstance(result, HumanLoopResult):
-                if iscoroutinefunction(fn):
-                    ret = await fn(*args, **kwargs)
-                else:
-                    ret = fn(*args, **kwargs)
-                return cast(R, ret)
-            else:
+        def check_result(result: Union[str, HumanLoopResult]) -> None:
+            if not isinstance(result, HumanLoopResult):
                 raise ValueError(
                     f"Conversation request timeout or error for {fn.__name__}"
                 )
 
-        @wraps(fn)
-        def sync_wrapper(*args: Any, **kwargs: Any) -> R:
-            ret = run_async_safely(async_wrapper(*args, **kwargs))
-            return cast(R, ret)
-
-        if iscoroutinefunction(fn):
-            return async_wrapper
-        return sync_wrapper
+        # Continues the conversation if it exists, otherwise starts it
+        return self._build_humanloop_wrapper(
+            fn,
+            task_id,
+            conversation_id,
+            loop_type=HumanLoopType.CONVERSATION,
+            question=question,
+            check_result=check_result,
+            ret_key=ret_key,
+            ret_key_required=True,
+            additional=additional,
+            metadata=metadata,
+            provider_id=provider_id,
+            timeout=timeout,
+            callback=callback,
+            upsert=True,
+        )
 
     def require_info(
         self,
@@ -576,9 +640,9 @@ class HumanloopAdapter:
         """Decorator for information gathering scenario"""
 
         if task_id is None:
-            task_id = str(uuid.uuid4())
+            task_id = _new_id()
         if conversation_id is None:
-            conversation_id = str(uuid.uuid4())
+            conversation_id = _new_id()
 
         def decorator(fn: Callable) -> Callable:
             return self._get_info_cli(
@@ -650,94 +714,35 @@ class HumanloopAdapter:
         - Automatically adapts to async and sync functions
         """
 
-        @wraps(fn)
-        async def async_wrapper(*args: Any, **kwargs: Any) -> R:
-            # Check if ret_key exists in function parameters
-            if ret_key not in fn.__code__.co_varnames:
-                raise ValueError(
-                    f"Function {fn.__name__} must have parameter named {ret_key}"
-                )
-
-            # Determine if callback is an instance or factory function
-            # callback: can be HumanLoopCallback instance or factory function
-            # - If factory function: accepts state parameter and returns HumanLoopCallback instance
-            # - If HumanLoopCallback instance: use directly
-            cb = None
-            if callable(callback) and not isinstance(callback, HumanLoopCallback):
-                # Factory function mode: get state from args and create callback instance
-                # state is typically the first argument, None if args is empty
-                state = args[0] if args else None
-                cb = callback(state)
-            else:
-                cb = callback
-
-            result = await self.manager.async_request_humanloop(
-                task_id=task_id,
-                conversation_id=conversation_id,
-                loop_type=HumanLoopType.INFORMATION,
-                context={
-                    "message": generate_function_summary(fn, args, kwargs),
-                    "function": {
-                        "function_name": fn.__name__,
-                        "function_signature": str(fn.__code__.co_varnames),
-                        "arguments": str(args),
-                        "keyword_arguments": str(kwargs),
-                        "documentation": fn.__doc__ or "No documentation available",
-                    },
-                    "question": "Please provide the required information for the human loop",
-                    "additional": additional,
-                },
-                timeout=timeout or self.default_timeout,
-                callback=cb,
-                metadata=metadata,
-                provider_id=provider_id,
-                blocking=True,
-            )
-            # Initialize response info object as None
-            resp_info = None
-
-            if isinstance(result, HumanLoopResult):
-                # If result is HumanLoopResult type, build complete response info
-                resp_info = {
-                    "conversation_id": result.conversation_id,
-                    "request_id": result.request_id,
-                    "loop_type": result.loop_type,
-                    "status": result.status,
-                    "response": result.response,
-                    "feedback": result.feedback,
-                    "responded_by": result.responded_by,
-                    "responded_at": result.responded_at,
-                    "error": result.error,
-                }
-                # Inject approval info into kwargs
-                kwargs[ret_key] = resp_info
-
+        def check_result(result: Union[str, HumanLoopResult]) -> None:
             # Check if result is valid
             if isinstance(result, HumanLoopResult):
                 # Return the information result, let user decide whether to use it
                 # Handle based on completed status
-                if result.status == HumanLoopStatus.COMPLETED:
-                    if iscoroutinefunction(fn):
-                        ret = await fn(*args, **kwargs)
-                    else:
-                        ret = fn(*args, **kwargs)
-                    return cast(R, ret)
-                else:
+                if result.status != HumanLoopStatus.COMPLETED:
                     raise ValueError(
                         f"Function {fn.__name__} infomartion request error: {result.status}"
                     )
             else:
                 raise ValueError(f"Info request timeout or error for {fn.__name__}")
 
-        @wraps(fn)
-        def sync_wrapper(*args: Any, **kwargs: Any) -> R:
-            ret = run_async_safely(async_wrapper(*args, **kwargs))
-            return cast(R, ret)
-
-        # Return corresponding wrapper based on decorated function type
-        if iscoroutinefunction(fn):
-            return async_wrapper
-        return sync_wrapper
+        return self._build_humanloop_wrapper(
+            fn,
+            task_id,
+            conversation_id,
+            loop_type=HumanLoopType.INFORMATION,
+            question=_constant_question(
+                "Please provide the required information for the human loop"
+            ),
+            check_result=check_result,
+            ret_key=ret_key,
+            ret_key_required=True,
+            additional=additional,
+            metadata=metadata,
+            provider_id=provider_id,
+            timeout=timeout,
+            callback=callback,
+        )
 
 
 class AgentOpsHumanLoopCallback(HumanLoopCallback):
@@ -747,6 +752,8 @@ class AgentOpsHumanLoopCallback(HumanLoopCallback):
     It records events, tracks metrics, and provides observability for human-agent interactions.
     """
 
+    __slots__ = ("session_tags", "_operation")
+
     def __init__(self, session_tags: Optional[List[str]] = None) -> None:
         self.session_tags = session_tags or ["gohumanloop"]
         self._operation = None
@@ -5,12 +5,19 @@ from typing import (
     Callable,
     Awaitable,
     TypeVar,
+    Tuple,
     Union,
 )
 import asyncio
+import functools
+import importlib.metadata
+import os
 import uuid
 import time
 import logging
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from inspect import isawaitable, iscoroutinefunction
 
 from gohumanloop.core.interface import (
     HumanLoopRequest,
@@ -22,7 +29,7 @@ from gohumanloop.core.interface import (
 )
 from gohumanloop.core.manager import DefaultHumanLoopManager
 from gohumanloop.providers.terminal_provider import TerminalProvider
-from gohumanloop.adapters.base_adapter import HumanloopAdapter
+from gohumanloop.adapters.base_adapter import HumanloopAdapter, get_active_state
 
 logger = logging.getLogger(__name__)
 
@@ -31,29 +38,21 @@ T = TypeVar("T")
 R = TypeVar("R", bound=Union[Any, None])
 
 
-# Check LangGraph version
-def _check_langgraph_version() -> bool:
-    """Check LangGraph version to determine if interrupt feature is supported"""
-    try:
-        import importlib.metadata
+# Interrupt support starts from LangGraph version 0.2.57
+_MIN_INTERRUPT_VERSION = (0, 2, 57)
 
-        version = importlib.metadata.version("langgraph")
-        version_parts = version.split(".")
-        major, minor, patch = (
-            int(version_parts[0]),
-            int(version_parts[1]),
-            int(version_parts[2]),
-        )
 
-        # Interrupt support starts from version 0.2.57
-        return major > 0 or (major == 0 and (minor > 2 or (minor == 2 and patch >= 57)))
-    except (importlib.metadata.PackageNotFoundError, ValueError, IndexError):
-        # If version cannot be determined, assume no support
-        return False
+def _get_langgraph_version() -> Tuple[int, ...]:
+    """Get installed LangGraph version as a tuple, empty if it cannot be determined"""
+    try:
+        version = importlib.metadata.version("langgraph")
+        return tuple(map(int, version.split(".")[:3]))
+    except (importlib.metadata.PackageNotFoundError, ValueError):
+        return ()
 
 
-# Import corresponding features based on version
-_SUPPORTS_INTERRUPT = _check_langgraph_version()
+# Detect version once at import time and import corresponding features
+_SUPPORTS_INTERRUPT = _get_langgraph_version() >= _MIN_INTERRUPT_VERSION
 if _SUPPORTS_INTERRUPT:
     try:
         from langgraph.types import interrupt as _lg_interrupt
@@ -62,54 +61,134 @@ if _SUPPORTS_INTERRUPT:
         _SUPPORTS_INTERRUPT = False
 
 
+# Shared executor for blocking user callbacks, created on first use
+_CB_EXECUTOR: Optional[ThreadPoolExecutor] = None
+
+
+def _get_callback_executor() -> ThreadPoolExecutor:
+    """Get the shared callback executor, creating it if necessary"""
+    global _CB_EXECUTOR
+    if _CB_EXECUTOR is None:
+        _CB_EXECUTOR = ThreadPoolExecutor(
+            max_workers=os.cpu_count(), thread_name_prefix="ghl-cb"
+        )
+    return _CB_EXECUTOR
+
+
 class LangGraphHumanLoopCallback(HumanLoopCallback):
-    """LangGraph-specific human loop callback, compatible with TypedDict or Pydantic BaseModel State"""
+    """LangGraph-specific human loop callback, compatible with TypedDict or Pydantic BaseModel State
+
+    When state is None, callbacks receive the state of the decorated call whose
+    human loop is running, so a single instance can be shared across calls
+    instead of passing a factory.
+
+    When run_in_executor=True, synchronous (blocking) callbacks are offloaded to a
+    shared thread pool so they do not stall the event loop; coroutine callbacks
+    still run on the loop. Callbacks executed in the pool must not block on
+    futures scheduled on the calling event loop (e.g. via .result()), as that
+    would deadlock.
+    """
+
+    __slots__ = (
+        "state",
+        "async_on_request",
+        "async_on_update",
+        "async_on_timeout",
+        "async_on_error",
+        "run_in_executor",
+    )
 
     def __init__(
         self,
-        state: Any,
+        state: Any = None,
         async_on_request: Optional[
-            Callable[[Any, HumanLoopProvider, HumanLoopRequest], Awaitable[Any]]
+            Callable[
+                [Any, HumanLoopProvider, HumanLoopRequest], Union[Awaitable[Any], Any]
+            ]
         ] = None,
         async_on_update: Optional[
-            Callable[[Any, HumanLoopProvider, HumanLoopResult], Awaitable[Any]]
+            Callable[
+                [Any, HumanLoopProvider, HumanLoopResult], Union[Awaitable[Any], Any]
+            ]
         ] = None,
         async_on_timeout: Optional[
-            Callable[[Any, HumanLoopProvider, HumanLoopResult], Awaitable[Any]]
+            Callable[
+                [Any, HumanLoopProvider, HumanLoopResult], Union[Awaitable[Any], Any]
+            ]
         ] = None,
         async_on_error: Optional[
-            Callable[[Any, HumanLoopProvider, Exception], Awaitable[Any]]
+            Callable[[Any, HumanLoopProvider, Exception], Union[Awaitable[Any], Any]]
         ] = None,
+        run_in_executor: bool = False,
     ) -> None:
         self.state = state
         self.async_on_request = async_on_request
         self.async_on_update = async_on_update
         self.async_on_timeout = async_on_timeout
         self.async_on_error = async_on_error
+        self.run_in_executor = run_in_executor
+
+    async def _async_invoke(self, cb: Callable[..., Any], *args: Any) -> Any:
+        """Invoke a user callback, offloading blocking callables if configured"""
+        # Without a bound state, use the state of the decorated call in progress
+        state = self.state if self.state is not None else get_active_state()
+        if self.run_in_executor and not iscoroutinefunction(cb):
+            loop = asyncio.get_running_loop()
+            ret = await loop.run_in_executor(
+                _get_callback_executor(), functools.partial(cb, state, *args)
+            )
+        else:
+            ret = cb(state, *args)
+        if isawaitable(ret):
+            ret = await ret
+        return ret
 
     async def async_on_humanloop_request(
         self, provider: HumanLoopProvider, request: HumanLoopRequest
     ) -> Any:
         if self.async_on_request:
-            await self.async_on_request(self.state, provider, request)
+            await self._async_invoke(self.async_on_request, provider, request)
 
     async def async_on_humanloop_update(
         self, provider: HumanLoopProvider, result: HumanLoopResult
     ) -> Any:
         if self.async_on_update:
-            await self.async_on_update(self.state, provider, result)
+            await self._async_invoke(self.async_on_update, provider, result)
 
     async def async_on_humanloop_timeout(
         self, provider: HumanLoopProvider, result: HumanLoopResult
     ) -> Any:
         if self.async_on_timeout:
-            await self.async_on_timeout(self.state, provider, result)
+            await self._async_invoke(self.async_on_timeout, provider, result)
 
     async def async_on_humanloop_error(
         self, provider: HumanLoopProvider, error: Exception
     ) -> Any:
         if self.async_on_error:
-            await self.async_on_error(self.state, provider, error)
+            await self._async_invoke(self.async_on_error, provider, error)
+
+
+_RESULT_LOG_FORMAT = (
+    "conversation_id=%s, "
+    "request_id=%s,"
+    "status=%s, "
+    "response=%s, "
+    "responded_by=%s, "
+    "responded_at=%s, "
+    "feedback=%s"
+)
+
+
+def _result_log_args(result: HumanLoopResult) -> Tuple[Any, ...]:
+    return (
+        result.conversation_id,
+        result.request_id,
+        result.status,
+        result.response,
+        result.responded_by,
+        result.responded_at,
+        result.feedback,
+    )
 
 
 def default_langgraph_callback_factory(state: Any) -> LangGraphHumanLoopCallback:
@@ -133,32 +212,32 @@ def default_langgraph_callback_factory(state: Any) -> LangGraphHumanLoopCallback
         state: Any, provider: HumanLoopProvider, request: HumanLoopRequest
     ) -> Any:
         """Log human interaction request events"""
-        logger.info(f"Provider ID: {provider.name}")
+        logger.info("Provider ID: %s", provider.name)
         logger.info(
-            f"Human interaction request "
-            f"task_id={request.task_id}, "
-            f"conversation_id={request.conversation_id}, "
-            f"loop_type={request.loop_type}, "
-            f"context={request.context}, "
-            f"metadata={request.metadata}, "
-            f"timeout={request.timeout}, "
-            f"created_at={request.created_at}"
+            "Human interaction request "
+            "task_id=%s, "
+            "conversation_id=%s, "
+            "loop_type=%s, "
+            "context=%s, "
+            "metadata=%s, "
+            "timeout=%s, "
+            "created_at=%s",
+            request.task_id,
+            request.conversation_id,
+            request.loop_type,
+            request.context,
+            request.metadata,
+            request.timeout,
+            request.created_at,
         )
 
     async def async_on_update(
         state: Any, provider: HumanLoopProvider, result: HumanLoopResult
     ) -> Any:
         """Log human interaction update events"""
-        logger.info(f"Provider ID: {provider.name}")
+        logger.info("Provider ID: %s", provider.name)
         logger.info(
-            f"Human interaction update "
-            f"conversation_id={result.conversation_id}, "
-            f"request_id={result.request_id},"
-            f"status={result.status}, "
-            f"response={result.response}, "
-            f"responded_by={result.responded_by}, "
-            f"responded_at={result.responded_at}, "
-            f"feedback={result.feedback}"
+            "Human interaction update " + _RESULT_LOG_FORMAT, *_result_log_args(result)
         )
 
     async def async_on_timeout(
@@ -166,21 +245,13 @@ def default_langgraph_callback_factory(state: Any) -> LangGraphHumanLoopCallback
     ) -> Any:
         """Log human interaction timeout events"""
 
-        logger.info(f"Provider ID: {provider.name}")
+        logger.info("Provider ID: %s", provider.name)
         logger.info(
-            f"Human interaction timeout "
-            f"conversation_id={result.conversation_id}, "
-            f"request_id={result.request_id},"
-            f"status={result.status}, "
-            f"response={result.response}, "
-            f"responded_by={result.responded_by}, "
-            f"responded_at={result.responded_at}, "
-            f"feedback={result.feedback}"
+            "Human interaction timeout " + _RESULT_LOG_FORMAT, *_result_log_args(result)
         )
-        from datetime import datetime
 
         current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.warning(f"Human interaction timeout - Time: {current_time}")
+        logger.warning("Human interaction timeout - Time: %s", current_time)
 
         # Alert logic can be added here, such as sending notifications
 
@@ -189,11 +260,12 @@ def default_langgraph_callback_factory(state: Any) -> LangGraphHumanLoopCallback
     ) -> Any:
         """Log human interaction error events"""
 
-        logger.info(f"Provider ID: {provider.name}")
-        from datetime import datetime
+        logger.info("Provider ID: %s", provider.name)
 
         current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.error(f"Human interaction error - Time: {current_time} Error: {error}")
+        logger.error(
+            "Human interaction error - Time: %s Error: %s", current_time, error
+        )
 
     return LangGraphHumanLoopCallback(
         state=state,
@@ -216,6 +288,46 @@ default_conversation_id = str(uuid.uuid4())
 
 _SKIP_NEXT_HUMANLOOP = False
 
+# Keep references to interrupt requests scheduled on a running loop
+_PENDING_INTERRUPT_TASKS: "set[asyncio.Task]" = set()
+
+
+def _on_interrupt_task_done(task: "asyncio.Task") -> None:
+    _PENDING_INTERRUPT_TASKS.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Error in interrupt: %s", task.exception())
+
+
+def _request_interrupt_humanloop(value: Any, lg_humanloop: HumanloopAdapter) -> None:
+    """Send the non-blocking human loop request that accompanies an interrupt
+
+    Inside a running event loop the request is scheduled as a task on that
+    loop; otherwise it is driven synchronously through the adapter.
+    """
+    context = {
+        "message": f"{value}",
+        "question": "The execution has been interrupted. Please review the above information and provide your input to continue.",
+    }
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    coro = lg_humanloop.manager.async_request_humanloop(
+        task_id="lg_interrupt",
+        conversation_id=default_conversation_id,
+        loop_type=HumanLoopType.INFORMATION,
+        context=context,
+        blocking=False,
+    )
+    if loop is None:
+        lg_humanloop._run_sync(coro)
+        return
+
+    task = loop.create_task(coro)
+    _PENDING_INTERRUPT_TASKS.add(task)
+    task.add_done_callback(_on_interrupt_task_done)
+
 
 def interrupt(value: Any, lg_humanloop: HumanloopAdapter = default_adapter) -> Any:
     """
@@ -240,20 +352,10 @@ def interrupt(value: Any, lg_humanloop: HumanloopAdapter = default_adapter) -> A
         )
 
     if not _SKIP_NEXT_HUMANLOOP:
-        # Get current event loop or create new one
         try:
-            lg_humanloop.manager.request_humanloop(
-                task_id="lg_interrupt",
-                conversation_id=default_conversation_id,
-                loop_type=HumanLoopType.INFORMATION,
-                context={
-                    "message": f"{value}",
-                    "question": "The execution has been interrupted. Please review the above information and provide your input to continue.",
-                },
-                blocking=False,
-            )
+            _request_interrupt_humanloop(value, lg_humanloop)
         except Exception as e:
-            logger.exception(f"Error in interrupt: {e}")
+            logger.exception("Error in interrupt: %s", e)
     else:
         # Reset flag to allow normal human intervention trigger next time
         _SKIP_NEXT_HUMANLOOP = False
@@ -283,7 +385,7 @@ def create_resume_command(lg_humanloop: HumanloopAdapter = default_adapter) -> A
             "You can use: pip install --upgrade langgraph>=0.2.57"
         )
 
-    # Define async polling function
+    # Define polling function for managers without status change notification
     def poll_for_result() -> Optional[Dict[str, Any]]:
         poll_interval = 1.0  # Polling interval (seconds)
         while True:
@@ -298,7 +400,15 @@ def create_resume_command(lg_humanloop: HumanloopAdapter = default_adapter) -> A
 
     _SKIP_NEXT_HUMANLOOP = True
 
-    response = poll_for_result()
+    response: Optional[Dict[str, Any]]
+    manager = lg_humanloop.manager
+    if isinstance(manager, DefaultHumanLoopManager):
+        # Wait for the status change notification instead of polling
+        response = manager.wait_for_conversation_status_change(
+            default_conversation_id
+        ).response
+    else:
+        response = poll_for_result()
     return _lg_Command(resume=response)
 
 
@@ -324,7 +434,7 @@ async def acreate_resume_command(
             "You can use: pip install --upgrade langgraph>=0.2.57"
         )
 
-    # Define async polling function
+    # Define async polling function for managers without status change notification
     async def poll_for_result() -> Optional[Dict[str, Any]]:
         poll_interval = 1.0  # Polling interval (seconds)
         while True:
@@ -339,6 +449,14 @@ async def acreate_resume_command(
 
     _SKIP_NEXT_HUMANLOOP = True
 
-    # Wait for async result directly
-    response = await poll_for_result()
+    response: Optional[Dict[str, Any]]
+    manager = lg_humanloop.manager
+    if isinstance(manager, DefaultHumanLoopManager):
+        # Wait for the status change notification instead of polling
+        result = await manager.async_wait_for_conversation_status_change(
+            default_conversation_id
+        )
+        response = result.response
+    else:
+        response = await poll_for_result()
     return _lg_Command(resume=response)
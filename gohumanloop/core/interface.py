@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
 from typing import (
     Any,
@@ -8,11 +10,12 @@ from typing import (
     Union,
 )
 from enum import Enum
-from dataclasses import dataclass, field
+from operator import attrgetter
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 
 
-class HumanLoopStatus(Enum):
+class HumanLoopStatus(str, Enum):
     """Enumeration of human-in-the-loop states"""
 
     PENDING = "pending"
@@ -25,7 +28,7 @@ class HumanLoopStatus(Enum):
     CANCELLED = "cancelled"  # For cancelled requests
 
 
-class HumanLoopType(Enum):
+class HumanLoopType(str, Enum):
     """Enumeration of human-in-the-loop types"""
 
     APPROVAL = "approval"  # Approval type
@@ -47,7 +50,7 @@ class HumanLoopType(Enum):
 """
 
 
-@dataclass
+@dataclass(slots=True)
 class HumanLoopRequest:
     """人机循环请求的数据模型 / Human loop request data model"""
 
@@ -65,7 +68,7 @@ class HumanLoopRequest:
     ] = None  # 将在请求创建时设置 / Will be set when request is created
 
 
-@dataclass
+@dataclass(slots=True)
 class HumanLoopResult:
     """人机循环结果的数据模型 / Human loop result data model"""
 
@@ -83,10 +86,22 @@ class HumanLoopResult:
     responded_at: Optional[str] = None  # 响应时间 / Response time
     error: Optional[str] = None  # 错误信息 / Error message
 
+    def as_dict(self) -> Dict[str, Any]:
+        """转换为浅拷贝字典（不递归复制字段值） / Shallow dict of all fields"""
+        return dict(zip(_RESULT_FIELDS, _get_result_fields(self)))
+
+
+_RESULT_FIELDS = tuple(f.name for f in fields(HumanLoopResult))
+_get_result_fields = attrgetter(*_RESULT_FIELDS)
+
 
 @runtime_checkable
 class HumanLoopProvider(Protocol):
-    """Human-in-the-loop Provider Protocol"""
+    """Human-in-the-loop Provider Protocol
+
+    实现方法中的 timeout 参数时，推荐使用 gohumanloop.utils.deadline(timeout)，
+    而不是 asyncio.wait_for，以免每次调用额外创建 Task。
+    """
 
     name: str  # 提供者名称
 
@@ -289,8 +304,12 @@ class HumanLoopProvider(Protocol):
         pass
 
 
-class HumanLoopCallback(ABC):
-    """人机循环回调的抽象类"""
+@runtime_checkable
+class HumanLoopCallback(Protocol):
+    """Human-in-the-loop Callback Protocol"""
+
+    # 不引入 __dict__，允许子类使用 __slots__
+    __slots__ = ()
 
     @abstractmethod
     async def async_on_humanloop_request(
@@ -724,6 +743,94 @@ class HumanLoopManager(ABC):
         """
         pass
 
+    async def async_upsert_humanloop(
+        self,
+        task_id: str,
+        conversation_id: str,
+        loop_type: HumanLoopType,
+        context: Dict[str, Any],
+        callback: Optional[HumanLoopCallback] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        provider_id: Optional[str] = None,
+        timeout: Optional[int] = None,
+        blocking: bool = False,
+        initial_context: Optional[Dict[str, Any]] = None,
+    ) -> Union[str, HumanLoopResult]:
+        """对话已存在时继续人机循环，否则发起新的人机循环
+
+        Args:
+            task_id: 任务标识符
+            conversation_id: 对话ID，用于多轮对话
+            loop_type: 新建对话时使用的循环类型
+            context: 提供给人类的上下文信息
+            callback: 回调对象（可选）
+            metadata: 附加元数据
+            provider_id: 使用特定提供者的ID（可选）
+            timeout: 请求超时时间（秒）
+            blocking: 是否阻塞等待结果
+            initial_context: 新建对话时代替 context 使用的首轮上下文（可选）
+
+        Returns:
+            Union[str, HumanLoopResult]: 如果blocking=False，返回请求ID；否则返回循环结果
+        """
+        if await self.async_check_conversation_exist(task_id, conversation_id):
+            return await self.async_continue_humanloop(
+                conversation_id=conversation_id,
+                context=context,
+                callback=callback,
+                metadata=metadata,
+                provider_id=provider_id,
+                timeout=timeout,
+                blocking=blocking,
+            )
+        return await self.async_request_humanloop(
+            task_id=task_id,
+            conversation_id=conversation_id,
+            loop_type=loop_type,
+            context=context if initial_context is None else initial_context,
+            callback=callback,
+            metadata=metadata,
+            provider_id=provider_id,
+            timeout=timeout,
+            blocking=blocking,
+        )
+
+    def upsert_humanloop(
+        self,
+        task_id: str,
+        conversation_id: str,
+        loop_type: HumanLoopType,
+        context: Dict[str, Any],
+        callback: Optional[HumanLoopCallback] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        provider_id: Optional[str] = None,
+        timeout: Optional[int] = None,
+        blocking: bool = False,
+        initial_context: Optional[Dict[str, Any]] = None,
+    ) -> Union[str, HumanLoopResult]:
+        """对话已存在时继续人机循环，否则发起新的人机循环（同步版本）"""
+        if self.check_conversation_exist(task_id, conversation_id):
+            return self.continue_humanloop(
+                conversation_id=conversation_id,
+                context=context,
+                callback=callback,
+                metadata=metadata,
+                provider_id=provider_id,
+                timeout=timeout,
+                blocking=blocking,
+            )
+        return self.request_humanloop(
+            task_id=task_id,
+            conversation_id=conversation_id,
+            loop_type=loop_type,
+            context=context if initial_context is None else initial_context,
+            callback=callback,
+            metadata=metadata,
+            provider_id=provider_id,
+            timeout=timeout,
+            blocking=blocking,
+        )
+
     @abstractmethod
     async def async_shutdown(self) -> None:
         """关闭管理器(异步方法)"""
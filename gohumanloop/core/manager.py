@@ -1,7 +1,11 @@
+from __future__ import annotations
+
 from typing import Dict, Any, Optional, List, Union
 import asyncio
+import itertools
+import logging
 from datetime import datetime
-from gohumanloop.utils import run_async_safely
+from gohumanloop.utils import deadline, run_async_safely
 
 from gohumanloop.core.interface import (
     HumanLoopRequest,
@@ -13,6 +17,16 @@ from gohumanloop.core.interface import (
     HumanLoopType,
 )
 
+logger = logging.getLogger(__name__)
+
+# 非终态：请求仍可能被响应或继续推进
+_NON_TERMINAL = frozenset({HumanLoopStatus.PENDING, HumanLoopStatus.INPROGRESS})
+
+# 提供者不支持状态变更通知时的轮询间隔（秒），从最小值按倍数退避到最大值
+_MIN_POLL_INTERVAL = 0.1
+_MAX_POLL_INTERVAL = 5.0
+_POLL_BACKOFF = 1.5
+
 
 class DefaultHumanLoopManager(HumanLoopManager):
     """默认人机循环管理器实现"""
@@ -24,21 +38,23 @@ class DefaultHumanLoopManager(HumanLoopManager):
         ] = None,
     ):
         self.providers: dict[str, HumanLoopProvider] = {}
+        # 自动生成提供者ID的计数器
+        self._provider_counter = itertools.count(1)
         self.default_provider_id = None
 
         # 存储请求和回调的映射
         self._callbacks: dict[tuple[str, str], HumanLoopCallback] = {}
-        # 存储请求的超时任务
-        self._timeout_tasks: dict[tuple[str, str], asyncio.Task] = {}
 
         # 存储task_id与conversation_id的映射关系
         self._task_conversations: dict[
             str, set[str]
         ] = {}  # task_id -> Set[conversation_id]
-        # 存储conversation_id与request_id的映射关系
+        # 存储conversation_id与task_id的反向映射（对话首次关联的task）
+        self._conversation_task: dict[str, str] = {}  # conversation_id -> task_id
+        # 存储conversation_id与request_id的映射关系（dict 作为保持插入顺序的集合）
         self._conversation_requests: dict[
-            str, list[str]
-        ] = {}  # conversation_id -> List[request_id]
+            str, dict[str, None]
+        ] = {}  # conversation_id -> {request_id: None}
         # 存储request_id与task_id的反向映射
         self._request_task: dict[
             tuple[str, str], str
@@ -66,7 +82,10 @@ class DefaultHumanLoopManager(HumanLoopManager):
     ) -> str:
         """同步注册提供者（用于初始化）"""
         if not provider_id:
-            provider_id = f"provider_{len(self.providers) + 1}"
+            provider_id = f"provider_{next(self._provider_counter)}"
+            # 跳过已被显式注册占用的名称
+            while provider_id in self.providers:
+                provider_id = f"provider_{next(self._provider_counter)}"
 
         self.providers[provider_id] = provider
 
@@ -100,7 +119,71 @@ class DefaultHumanLoopManager(HumanLoopManager):
         blocking: bool = False,
     ) -> Union[str, HumanLoopResult]:
         """请求人机循环"""
-        # 确定使用哪个提供者
+        provider_id = self._resolve_request_provider(conversation_id, provider_id)
+        provider = self.providers[provider_id]
+
+        try:
+            # 发送请求
+            result = await provider.async_request_humanloop(
+                task_id=task_id,
+                conversation_id=conversation_id,
+                loop_type=loop_type,
+                context=context,
+                metadata=metadata,
+                timeout=timeout,
+            )
+            return await self._async_register_request(
+                result,
+                task_id=task_id,
+                conversation_id=conversation_id,
+                loop_type=loop_type,
+                context=context,
+                callback=callback,
+                metadata=metadata,
+                provider_id=provider_id,
+                timeout=timeout,
+                blocking=blocking,
+            )
+        except Exception as e:
+            # 处理请求过程中的异常
+            if callback:
+                await self._async_notify_error(callback, provider, e)
+            raise  # 重新抛出异常，让调用者知道发生了错误
+
+    async def _async_notify_error(
+        self,
+        callback: HumanLoopCallback,
+        provider: HumanLoopProvider,
+        error: Exception,
+    ) -> None:
+        """调用错误回调，错误回调自身失败时只记录日志"""
+        try:
+            await callback.async_on_humanloop_error(provider, error)
+        except Exception:
+            logger.exception(
+                "Humanloop error callback failed while handling: %r", error
+            )
+
+    def _resolve_provider(self, provider_id: Optional[str]) -> HumanLoopProvider:
+        """获取指定的提供者，未指定时使用默认提供者"""
+        provider_id = provider_id or self.default_provider_id
+        provider = self.providers.get(provider_id) if provider_id else None
+        if provider is None:
+            raise ValueError(f"Provider '{provider_id}' not found")
+        return provider
+
+    def _resolve_conversation_provider(
+        self, conversation_id: str, provider_id: Optional[str]
+    ) -> HumanLoopProvider:
+        """获取对话使用的提供者，未指定时优先使用对话已关联的提供者"""
+        if provider_id is None:
+            provider_id = self._conversation_provider.get(conversation_id)
+        return self._resolve_provider(provider_id)
+
+    def _resolve_request_provider(
+        self, conversation_id: str, provider_id: Optional[str]
+    ) -> str:
+        """确定新请求使用的提供者ID"""
         provider_id = provider_id or self.default_provider_id
         if not provider_id or provider_id not in self.providers:
             raise ValueError(f"Provider '{provider_id}' not found")
@@ -113,79 +196,74 @@ class DefaultHumanLoopManager(HumanLoopManager):
             raise ValueError(
                 f"Conversation '{conversation_id}' already exists with a different provider"
             )
+        return provider_id
 
+    async def _async_register_request(
+        self,
+        result: HumanLoopResult,
+        task_id: str,
+        conversation_id: str,
+        loop_type: HumanLoopType,
+        context: Dict[str, Any],
+        callback: Optional[HumanLoopCallback],
+        metadata: Optional[Dict[str, Any]],
+        provider_id: str,
+        timeout: Optional[int],
+        blocking: bool,
+    ) -> Union[str, HumanLoopResult]:
+        """记录提供者返回的新请求，并按需等待结果"""
         provider = self.providers[provider_id]
+        request_id = result.request_id
 
-        try:
-            # 发送请求
-            result = await provider.async_request_humanloop(
-                task_id=task_id,
-                conversation_id=conversation_id,
-                loop_type=loop_type,
-                context=context,
-                metadata=metadata,
-                timeout=timeout,
+        if not request_id:
+            raise ValueError(
+                f"Failed to request humanloop for conversation '{conversation_id}'"
             )
 
-            request_id = result.request_id
-
-            if not request_id:
-                raise ValueError(
-                    f"Failed to request humanloop for conversation '{conversation_id}'"
-                )
-
-            # 存储task_id、conversation_id和request_id的关系
-            if task_id not in self._task_conversations:
-                self._task_conversations[task_id] = set()
-            self._task_conversations[task_id].add(conversation_id)
+        # 存储task_id、conversation_id和request_id的关系
+        if task_id not in self._task_conversations:
+            self._task_conversations[task_id] = set()
+        self._task_conversations[task_id].add(conversation_id)
+        self._conversation_task.setdefault(conversation_id, task_id)
 
-            if conversation_id not in self._conversation_requests:
-                self._conversation_requests[conversation_id] = []
-            self._conversation_requests[conversation_id].append(request_id)
+        self._conversation_requests.setdefault(conversation_id, {})[request_id] = None
 
-            self._request_task[(conversation_id, request_id)] = task_id
-            # 存储对话对应的provider_id
-            self._conversation_provider[conversation_id] = provider_id
+        self._request_task[(conversation_id, request_id)] = task_id
+        # 存储对话对应的provider_id
+        self._conversation_provider[conversation_id] = provider_id
 
-            # 如果提供了回调，存储它
-            if callback:
-                try:
-                    # 创建请求对象
-                    request = HumanLoopRequest(
-                        task_id=task_id,
-                        conversation_id=conversation_id,
-                        loop_type=loop_type,
-                        context=context,
-                        metadata=metadata or {},
-                        timeout=timeout,
-                        created_at=datetime.now(),
-                    )
-                    await callback.async_on_humanloop_request(provider, request)
-                except Exception as e:
-                    # 处理回调执行过程中的异常
-                    try:
-                        await callback.async_on_humanloop_error(provider, e)
-                    except Exception:
-                        # 如果错误回调也失败，只能忽略
-                        pass
-                self._callbacks[(conversation_id, request_id)] = callback
+        # 如果提供了回调，存储它
+        if callback:
+            try:
+                # 创建请求对象
+                request = HumanLoopRequest(
+                    task_id=task_id,
+                    conversation_id=conversation_id,
+                    loop_type=loop_type,
+                    context=context,
+                    metadata=metadata or {},
+                    timeout=timeout,
+                    created_at=datetime.now(),
+                )
+                await callback.async_on_humanloop_request(provider, request)
+            except Exception as e:
+                # 处理回调执行过程中的异常
+                await self._async_notify_error(callback, provider, e)
+            self._callbacks[(conversation_id, request_id)] = callback
 
-            # 如果是阻塞模式，等待结果
-            if blocking:
-                return await self._async_wait_for_result(
-                    conversation_id, request_id, provider, timeout
+        # 如果是阻塞模式，等待结果
+        if blocking:
+            # 提供者已直接给出最终结果时无需再等待
+            if result.status != HumanLoopStatus.PENDING:
+                await self._async_trigger_update_callback(
+                    conversation_id, request_id, provider, result
                 )
-            else:
-                return request_id
-        except Exception as e:
-            # 处理请求过程中的异常
-            if callback:
-                try:
-                    await callback.async_on_humanloop_error(provider, e)
-                except Exception:
-                    # 如果错误回调也失败，只能忽略
-                    pass
-            raise  # 重新抛出异常，让调用者知道发生了错误
+                return result
+            return await self._async_wait_for_result(
+                conversation_id, request_id, provider, timeout
+            )
+        else:
+            return request_id
 
     def request_humanloop(
         self,
@@ -261,16 +339,12 @@ class DefaultHumanLoopManager(HumanLoopManager):
                 )
 
             # 更新conversation_id和request_id的关系
-            if conversation_id not in self._conversation_requests:
-                self._conversation_requests[conversation_id] = []
-            self._conversation_requests[conversation_id].append(request_id)
+            self._conversation_requests.setdefault(conversation_id, {})[
+                request_id
+            ] = None
 
             # 查找此conversation_id对应的task_id
-            task_id = None
-            for t_id, convs in self._task_conversations.items():
-                if conversation_id in convs:
-                    task_id = t_id
-                    break
+            task_id = self._conversation_task.get(conversation_id)
 
             if task_id:
                 self._request_task[(conversation_id, request_id)] = task_id
@@ -295,15 +369,17 @@ class DefaultHumanLoopManager(HumanLoopManager):
                     await callback.async_on_humanloop_request(provider, request)
                 except Exception as e:
                     # 处理回调执行过程中的异常
-                    try:
-                        await callback.async_on_humanloop_error(provider, e)
-                    except Exception:
-                        # 如果错误回调也失败，只能忽略
-                        pass
+                    await self._async_notify_error(callback, provider, e)
                 self._callbacks[(conversation_id, request_id)] = callback
 
             # 如果是阻塞模式，等待结果
             if blocking:
+                # 提供者已直接给出最终结果时无需再等待
+                if result.status != HumanLoopStatus.PENDING:
+                    await self._async_trigger_update_callback(
+                        conversation_id, request_id, provider, result
+                    )
+                    return result
                 return await self._async_wait_for_result(
                     conversation_id, request_id, provider, timeout
                 )
@@ -312,11 +388,7 @@ class DefaultHumanLoopManager(HumanLoopManager):
         except Exception as e:
             # 处理继续请求过程中的异常
             if callback:
-                try:
-                    await callback.async_on_humanloop_error(provider, e)
-                except Exception:
-                    # 如果错误回调也失败，只能忽略
-                    pass
+                await self._async_notify_error(callback, provider, e)
             raise  # 重新抛出异常，让调用者知道发生了错误
 
     def continue_humanloop(
@@ -350,25 +422,15 @@ class DefaultHumanLoopManager(HumanLoopManager):
     ) -> HumanLoopResult:
         """检查请求状态"""
         # 如果没有指定provider_id，尝试从存储的映射中获取
-        if provider_id is None:
-            stored_provider_id = self._conversation_provider.get(conversation_id)
-            provider_id = stored_provider_id or self.default_provider_id
-
-        if not provider_id or provider_id not in self.providers:
-            raise ValueError(f"Provider '{provider_id}' not found")
-
-        provider = self.providers[provider_id]
+        provider = self._resolve_conversation_provider(conversation_id, provider_id)
 
         try:
             result = await provider.async_check_request_status(
                 conversation_id, request_id
             )
 
-            # 如果有回调且状态不是等待或进行中，触发状态更新回调
-            if (
-                conversation_id,
-                request_id,
-            ) in self._callbacks and result.status not in [HumanLoopStatus.PENDING]:
+            # 如果状态不是等待中，触发状态更新回调（没有回调时直接返回）
+            if result.status != HumanLoopStatus.PENDING:
                 await self._async_trigger_update_callback(
                     conversation_id, request_id, provider, result
                 )
@@ -378,11 +440,7 @@ class DefaultHumanLoopManager(HumanLoopManager):
             # 处理检查状态过程中的异常
             callback = self._callbacks.get((conversation_id, request_id))
             if callback:
-                try:
-                    await callback.async_on_humanloop_error(provider, e)
-                except Exception:
-                    # 如果错误回调也失败，只能忽略
-                    pass
+                await self._async_notify_error(callback, provider, e)
             raise  # 重新抛出异常，让调用者知道发生了错误
 
     def check_request_status(
@@ -405,15 +463,7 @@ class DefaultHumanLoopManager(HumanLoopManager):
     ) -> HumanLoopResult:
         """检查对话状态"""
         # 优先使用对话已关联的提供者
-        if provider_id is None:
-            stored_provider_id = self._conversation_provider.get(conversation_id)
-            provider_id = stored_provider_id or self.default_provider_id
-
-        if not provider_id or provider_id not in self.providers:
-            raise ValueError(f"Provider '{provider_id}' not found")
-
-        #  检查对话指定provider_id或默认provider_id最后一次请求的状态
-        provider = self.providers[provider_id]
+        provider = self._resolve_conversation_provider(conversation_id, provider_id)
 
         try:
             #  检查对话指定provider_id或默认provider_id最后一次请求的状态
@@ -423,10 +473,12 @@ class DefaultHumanLoopManager(HumanLoopManager):
                 conversation_id in self._conversation_requests
                 and self._conversation_requests[conversation_id]
             ):
-                last_request_id = self._conversation_requests[conversation_id][-1]
+                last_request_id = next(
+                    reversed(self._conversation_requests[conversation_id])
+                )
                 callback = self._callbacks.get((conversation_id, last_request_id))
 
-                if callback and result.status not in [HumanLoopStatus.PENDING]:
+                if callback and result.status != HumanLoopStatus.PENDING:
                     # 如果有回调且状态不是等待或进行中，触发状态更新回调
                     await self._async_trigger_update_callback(
                         conversation_id, last_request_id, provider, result
@@ -437,11 +489,7 @@ class DefaultHumanLoopManager(HumanLoopManager):
             # 处理检查对话状态过程中的异常
             # 尝试找到与此对话关联的最后一个请求的回调
             if callback:
-                try:
-                    await callback.async_on_humanloop_error(provider, e)
-                except Exception:
-                    # 如果错误回调也失败，只能忽略
-                    pass
+                await self._async_notify_error(callback, provider, e)
             raise  # 重新抛出异常，让调用者知道发生了错误
 
     def check_conversation_status(
@@ -461,32 +509,19 @@ class DefaultHumanLoopManager(HumanLoopManager):
         self, conversation_id: str, request_id: str, provider_id: Optional[str] = None
     ) -> bool:
         """取消特定请求"""
-        if provider_id is None:
-            stored_provider_id = self._conversation_provider.get(conversation_id)
-            provider_id = stored_provider_id or self.default_provider_id
-
-        if not provider_id or provider_id not in self.providers:
-            raise ValueError(f"Provider '{provider_id}' not found")
-
-        provider = self.providers[provider_id]
-
-        # 取消超时任务
-        if (conversation_id, request_id) in self._timeout_tasks:
-            self._timeout_tasks[(conversation_id, request_id)].cancel()
-            del self._timeout_tasks[(conversation_id, request_id)]
+        provider = self._resolve_conversation_provider(conversation_id, provider_id)
 
-        # 从回调映射中删除
-        if (conversation_id, request_id) in self._callbacks:
-            del self._callbacks[(conversation_id, request_id)]
+        key = (conversation_id, request_id)
+        # 删除回调
+        self._release_request(key)
 
         # 清理request关联
-        if (conversation_id, request_id) in self._request_task:
-            del self._request_task[(conversation_id, request_id)]
+        self._request_task.pop(key, None)
 
         # 从conversation_requests中移除
-        if conversation_id in self._conversation_requests:
-            if request_id in self._conversation_requests[conversation_id]:
-                self._conversation_requests[conversation_id].remove(request_id)
+        conversation_requests = self._conversation_requests.get(conversation_id)
+        if conversation_requests is not None:
+            conversation_requests.pop(request_id, None)
 
         return await provider.async_cancel_request(conversation_id, request_id)
 
@@ -510,58 +545,33 @@ class DefaultHumanLoopManager(HumanLoopManager):
     ) -> bool:
         """取消整个对话"""
         # 优先使用对话已关联的提供者
-        if provider_id is None:
-            stored_provider_id = self._conversation_provider.get(conversation_id)
-            provider_id = stored_provider_id or self.default_provider_id
-
-        if not provider_id or provider_id not in self.providers:
-            raise ValueError(f"Provider '{provider_id}' not found")
+        provider = self._resolve_conversation_provider(conversation_id, provider_id)
 
-        provider = self.providers[provider_id]
-
-        # 取消与此对话相关的所有超时任务和回调
-        keys_to_remove = []
-        for key in self._timeout_tasks:
-            if key[0] == conversation_id:
-                self._timeout_tasks[key].cancel()
-                keys_to_remove.append(key)
-
-        for key in keys_to_remove:
-            del self._timeout_tasks[key]
-
-        keys_to_remove = []
-        for key in self._callbacks:
-            if key[0] == conversation_id:
-                keys_to_remove.append(key)
-
-        for key in keys_to_remove:
-            del self._callbacks[key]
-
-        # 清理与此对话相关的task映射关系
-        # 1. 从task_conversations中移除此对话
-        task_ids_to_update = []
-        for task_id, convs in self._task_conversations.items():
-            if conversation_id in convs:
-                task_ids_to_update.append(task_id)
-
-        for task_id in task_ids_to_update:
-            self._task_conversations[task_id].remove(conversation_id)
+        # 只遍历此对话自己的请求，清理回调和task映射关系
+        request_ids = self._conversation_requests.pop(conversation_id, {})
+        task_ids = set()
+        for request_id in request_ids:
+            key = (conversation_id, request_id)
+            self._callbacks.pop(key, None)
+            task_id = self._request_task.pop(key, None)
+            if task_id is not None:
+                task_ids.add(task_id)
+
+        conversation_task_id = self._conversation_task.pop(conversation_id, None)
+        if conversation_task_id is not None:
+            task_ids.add(conversation_task_id)
+
+        # 从task_conversations中移除此对话
+        for task_id in task_ids:
+            conversations = self._task_conversations.get(task_id)
+            if conversations is None:
+                continue
+            conversations.discard(conversation_id)
             # 如果task没有关联的对话了，可以考虑删除该task记录
-            if not self._task_conversations[task_id]:
+            if not conversations:
                 del self._task_conversations[task_id]
 
-        # 2. 获取并清理所有与此对话相关的请求
-        request_ids = self._conversation_requests.get(conversation_id, [])
-        for request_id in request_ids:
-            # 清理request_task映射
-            if (conversation_id, request_id) in self._request_task:
-                del self._request_task[(conversation_id, request_id)]
-
-        # 3. 清理conversation_requests映射
-        if conversation_id in self._conversation_requests:
-            del self._conversation_requests[conversation_id]
-
-        # 4. 清理provider关联
+        # 清理provider关联
         if conversation_id in self._conversation_provider:
             del self._conversation_provider[conversation_id]
 
@@ -584,20 +594,11 @@ class DefaultHumanLoopManager(HumanLoopManager):
         self, provider_id: Optional[str] = None
     ) -> HumanLoopProvider:
         """获取指定的提供者实例"""
-        provider_id = provider_id or self.default_provider_id
-        if not provider_id or provider_id not in self.providers:
-            raise ValueError(f"Provider '{provider_id}' not found")
-
-        return self.providers[provider_id]
+        return self._resolve_provider(provider_id)
 
     def get_provider(self, provider_id: Optional[str] = None) -> HumanLoopProvider:
         """获取指定的提供者实例（同步版本）"""
-
-        result: HumanLoopProvider = run_async_safely(
-            self.async_get_provider(provider_id=provider_id)
-        )
-
-        return result
+        return self._resolve_provider(provider_id)
 
     async def async_list_providers(self) -> Dict[str, HumanLoopProvider]:
         """列出所有注册的提供者"""
@@ -605,30 +606,20 @@ class DefaultHumanLoopManager(HumanLoopManager):
 
     def list_providers(self) -> Dict[str, HumanLoopProvider]:
         """列出所有注册的提供者（同步版本）"""
-
-        result: Dict[str, HumanLoopProvider] = run_async_safely(
-            self.async_list_providers()
-        )
-
-        return result
+        return self.providers
 
     async def async_set_default_provider(self, provider_id: str) -> bool:
         """设置默认提供者"""
+        return self.set_default_provider(provider_id)
+
+    def set_default_provider(self, provider_id: str) -> bool:
+        """设置默认提供者（同步版本）"""
         if provider_id not in self.providers:
             raise ValueError(f"Provider '{provider_id}' not found")
 
         self.default_provider_id = provider_id
         return True
 
-    def set_default_provider(self, provider_id: str) -> bool:
-        """设置默认提供者（同步版本）"""
-
-        result: bool = run_async_safely(
-            self.async_set_default_provider(provider_id=provider_id)
-        )
-
-        return result
-
     async def _async_wait_for_result(
         self,
         conversation_id: str,
@@ -636,9 +627,11 @@ class DefaultHumanLoopManager(HumanLoopManager):
         provider: HumanLoopProvider,
         timeout: Optional[int] = None,
     ) -> HumanLoopResult:
-        """等待循环结果"""
-        poll_interval = 1.0  # 轮询间隔（秒）
+        """等待循环结果
 
+        按指数退避间隔轮询，提供者支持状态变更通知时可在状态变化时提前唤醒
+        """
+        poll_interval = _MIN_POLL_INTERVAL
         while True:
             result = await self.async_check_request_status(
                 conversation_id, request_id, provider.name
@@ -648,8 +641,103 @@ class DefaultHumanLoopManager(HumanLoopManager):
             if result.status != HumanLoopStatus.PENDING:
                 return result
 
-            # 等待一段时间后再次轮询
+            await self._async_wait_for_provider_update(
+                provider, conversation_id, request_id, result.status, poll_interval
+            )
+            poll_interval = min(poll_interval * _POLL_BACKOFF, _MAX_POLL_INTERVAL)
+
+    async def async_wait_for_conversation_status_change(
+        self,
+        conversation_id: str,
+        provider_id: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> HumanLoopResult:
+        """等待对话最新请求离开PENDING状态
+
+        提供者支持状态变更通知时（如BaseProvider），在状态变化时被唤醒，
+        同时按指数退避间隔轮询，以兼容不发出通知的提供者。
+
+        Args:
+            conversation_id: 对话标识符
+            provider_id: 使用特定提供者的ID（可选）
+            timeout: 最长等待时间（秒），None表示不限制
+
+        Returns:
+            HumanLoopResult: 对话最新请求的非PENDING状态结果
+
+        Raises:
+            asyncio.TimeoutError: 如果在超时时间内状态未发生变化
+        """
+        async with deadline(timeout):
+            return await self._async_wait_for_conversation_status_change(
+                conversation_id, provider_id
+            )
+
+    def wait_for_conversation_status_change(
+        self,
+        conversation_id: str,
+        provider_id: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> HumanLoopResult:
+        """等待对话最新请求离开PENDING状态（同步版本）"""
+
+        result: HumanLoopResult = run_async_safely(
+            self.async_wait_for_conversation_status_change(
+                conversation_id=conversation_id,
+                provider_id=provider_id,
+                timeout=timeout,
+            )
+        )
+
+        return result
+
+    async def _async_wait_for_conversation_status_change(
+        self,
+        conversation_id: str,
+        provider_id: Optional[str] = None,
+    ) -> HumanLoopResult:
+        poll_interval = _MIN_POLL_INTERVAL
+        while True:
+            result = await self.async_check_conversation_status(
+                conversation_id, provider_id
+            )
+            if result.status != HumanLoopStatus.PENDING:
+                return result
+
+            provider = self._resolve_conversation_provider(conversation_id, provider_id)
+            await self._async_wait_for_provider_update(
+                provider,
+                conversation_id,
+                result.request_id,
+                result.status,
+                poll_interval,
+            )
+            poll_interval = min(poll_interval * _POLL_BACKOFF, _MAX_POLL_INTERVAL)
+
+    async def _async_wait_for_provider_update(
+        self,
+        provider: HumanLoopProvider,
+        conversation_id: str,
+        request_id: str,
+        status: HumanLoopStatus,
+        poll_interval: float,
+    ) -> None:
+        """等待提供者中请求状态离开 status，最多等待 poll_interval 秒
+
+        状态变更通知只是提前唤醒的手段：提供者可能不经 _notify_status_change
+        就改变状态（如直接从远端拉取），因此超时后仍由调用方重新查询状态。
+        """
+        wait_for_status_change = getattr(provider, "async_wait_for_status_change", None)
+        if wait_for_status_change is None:
             await asyncio.sleep(poll_interval)
+            return
+        try:
+            await asyncio.wait_for(
+                wait_for_status_change(conversation_id, request_id, status),
+                poll_interval,
+            )
+        except asyncio.TimeoutError:
+            pass
 
     async def _async_trigger_update_callback(
         self,
@@ -659,27 +747,27 @@ class DefaultHumanLoopManager(HumanLoopManager):
         result: HumanLoopResult,
     ) -> None:
         """触发状态更新回调"""
-        callback: Optional[HumanLoopCallback] = self._callbacks.get(
-            (conversation_id, request_id)
-        )
+        key = (conversation_id, request_id)
+        callback: Optional[HumanLoopCallback] = self._callbacks.get(key)
         if callback:
             try:
                 await callback.async_on_humanloop_update(provider, result)
                 if result.status == HumanLoopStatus.EXPIRED:
                     await callback.async_on_humanloop_timeout(provider, result)
-                # 如果状态是最终状态，可以考虑移除回调
-                if result.status not in [
-                    HumanLoopStatus.PENDING,
-                    HumanLoopStatus.INPROGRESS,
-                ]:
-                    del self._callbacks[(conversation_id, request_id)]
             except Exception as e:
                 # 处理回调执行过程中的异常
-                try:
-                    await callback.async_on_humanloop_error(provider, e)
-                except Exception:
-                    # 如果错误回调也失败，只能忽略
-                    pass
+                await self._async_notify_error(callback, provider, e)
+
+        # 请求进入最终状态后释放只在等待期间需要的资源
+        if result.status not in _NON_TERMINAL:
+            self._release_request(key)
+
+    def _release_request(self, key: tuple[str, str]) -> None:
+        """删除请求的回调
+
+        请求与任务、对话的关联保留，以便之后查询和同步
+        """
+        self._callbacks.pop(key, None)
 
         # 添加新方法用于获取task相关信息
 
@@ -692,7 +780,7 @@ class DefaultHumanLoopManager(HumanLoopManager):
         Returns:
             List[str]: 与任务关联的对话ID列表
         """
-        return list(self._task_conversations.get(task_id, set()))
+        return self.get_task_conversations(task_id)
 
     def get_task_conversations(self, task_id: str) -> List[str]:
         """获取任务关联的所有对话ID
@@ -714,8 +802,7 @@ class DefaultHumanLoopManager(HumanLoopManager):
         Returns:
             List[str]: 与对话关联的请求ID列表
         """
-        ret: List[str] = self._conversation_requests.get(conversation_id, [])
-        return ret
+        return self.get_conversation_requests(conversation_id)
 
     def get_conversation_requests(self, conversation_id: str) -> List[str]:
         """获取对话关联的所有请求ID
@@ -726,9 +813,7 @@ class DefaultHumanLoopManager(HumanLoopManager):
         Returns:
             List[str]: 与对话关联的请求ID列表
         """
-        ret: List[str] = self._conversation_requests.get(conversation_id, [])
-
-        return ret
+        return list(self._conversation_requests.get(conversation_id, ()))
 
     async def async_get_request_task(
         self, conversation_id: str, request_id: str
@@ -775,19 +860,7 @@ class DefaultHumanLoopManager(HumanLoopManager):
         Returns:
             bool: 如果对话存在返回True，否则返回False
         """
-        # 检查task_id是否存在且conversation_id是否在该task的对话集合中
-        if (
-            task_id in self._task_conversations
-            and conversation_id in self._task_conversations[task_id]
-        ):
-            # 进一步验证该对话是否有关联的请求
-            if (
-                conversation_id in self._conversation_requests
-                and self._conversation_requests[conversation_id]
-            ):
-                return True
-
-        return False
+        return self.check_conversation_exist(task_id, conversation_id)
 
     def check_conversation_exist(
         self,
@@ -0,0 +1,202 @@
+from typing import Dict, Any, Optional, List, Tuple, Union
+import asyncio
+
+from gohumanloop.core.manager import DefaultHumanLoopManager
+from gohumanloop.core.interface import (
+    HumanLoopProvider,
+    HumanLoopCallback,
+    HumanLoopRequest,
+    HumanLoopResult,
+    HumanLoopType,
+)
+
+
+class BatchingHumanLoopManager(DefaultHumanLoopManager):
+    """
+    合并并发请求的人机循环管理器
+
+    在 batch_window 秒的时间窗口内到达的 request_humanloop 调用会被收集起来，
+    通过一次 async_request_humanloop_many 统一提交；阻塞模式的请求在提交后再各自等待结果。
+    适用于 LangGraph 扇出等大量节点同时发起人机交互的场景。
+    """
+
+    def __init__(
+        self,
+        initial_providers: Optional[
+            Union[HumanLoopProvider, List[HumanLoopProvider]]
+        ] = None,
+        batch_window: float = 0.01,
+    ):
+        super().__init__(initial_providers)
+        self.batch_window = batch_window
+        # 每个事件循环各自待提交的请求及其结果 Future
+        self._pending: Dict[
+            asyncio.AbstractEventLoop,
+            List[Tuple[Dict[str, Any], "asyncio.Future[Any]"]],
+        ] = {}
+        # 保持提交任务的引用，防止被垃圾回收
+        self._submit_tasks: "set[asyncio.Task]" = set()
+
+    async def async_request_humanloop(
+        self,
+        task_id: str,
+        conversation_id: str,
+        loop_type: HumanLoopType,
+        context: Dict[str, Any],
+        callback: Optional[HumanLoopCallback] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        provider_id: Optional[str] = None,
+        timeout: Optional[int] = None,
+        blocking: bool = False,
+    ) -> Union[str, HumanLoopResult]:
+        """请求人机循环（在批处理窗口内合并提交）"""
+        request_id: Union[str, HumanLoopResult] = await self._async_enqueue(
+            {
+                "task_id": task_id,
+                "conversation_id": conversation_id,
+                "loop_type": loop_type,
+                "context": context,
+                "callback": callback,
+                "metadata": metadata,
+                "provider_id": provider_id,
+                "timeout": timeout,
+                "blocking": False,
+            }
+        )
+        if not blocking:
+            return request_id
+
+        provider = self.providers[self._conversation_provider[conversation_id]]
+        try:
+            return await self._async_wait_for_result(
+                conversation_id, str(request_id), provider, timeout
+            )
+        except Exception as e:
+            if callback:
+                await self._async_notify_error(callback, provider, e)
+            raise
+
+    async def async_request_humanloop_many(
+        self, requests: List[Dict[str, Any]]
+    ) -> List[Union[str, HumanLoopResult, BaseException]]:
+        """一次性提交多个人机循环请求，单个请求失败不影响其他请求
+
+        同一提供者的请求通过一次 async_request_humanloop_batch 提交；
+        未实现该方法的提供者退化为逐个并发调用 async_request_humanloop。
+        """
+        results: List[Union[str, HumanLoopResult, BaseException]] = [
+            ValueError("Request was not submitted")
+        ] * len(requests)
+        groups: Dict[str, List[int]] = {}
+        for index, request in enumerate(requests):
+            try:
+                provider_id = self._resolve_request_provider(
+                    request["conversation_id"], request.get("provider_id")
+                )
+            except ValueError as e:
+                results[index] = e
+                continue
+            groups.setdefault(provider_id, []).append(index)
+
+        async def submit(provider_id: str, indices: List[int]) -> None:
+            provider = self.providers[provider_id]
+            batch = [
+                HumanLoopRequest(
+                    task_id=requests[index]["task_id"],
+                    conversation_id=requests[index]["conversation_id"],
+                    loop_type=requests[index]["loop_type"],
+                    context=requests[index]["context"],
+                    metadata=requests[index].get("metadata") or {},
+                    timeout=requests[index].get("timeout"),
+                )
+                for index in indices
+            ]
+            provider_results = await self._async_provider_batch(provider, batch)
+            for index, result in zip(indices, provider_results):
+                request = requests[index]
+                callback = request.get("callback")
+                try:
+                    if isinstance(result, BaseException):
+                        raise result
+                    if not result.request_id and result.error:
+                        raise ValueError(result.error)
+                    results[index] = await self._async_register_request(
+                        result,
+                        task_id=request["task_id"],
+                        conversation_id=request["conversation_id"],
+                        loop_type=request["loop_type"],
+                        context=request["context"],
+                        callback=callback,
+                        metadata=request.get("metadata"),
+                        provider_id=provider_id,
+                        timeout=request.get("timeout"),
+                        blocking=request.get("blocking", False),
+                    )
+                except Exception as e:
+                    if callback:
+                        await self._async_notify_error(callback, provider, e)
+                    results[index] = e
+
+        await asyncio.gather(
+            *(submit(provider_id, indices) for provider_id, indices in groups.items())
+        )
+        return results
+
+    async def _async_provider_batch(
+        self, provider: HumanLoopProvider, batch: List[HumanLoopRequest]
+    ) -> List[Union[HumanLoopResult, BaseException]]:
+        """调用提供者的批量接口，兼容未实现该接口的提供者"""
+        request_batch = getattr(provider, "async_request_humanloop_batch", None)
+        try:
+            if request_batch is not None:
+                return list(await request_batch(batch))
+            return await asyncio.gather(
+                *(
+                    provider.async_request_humanloop(
+                        task_id=request.task_id,
+                        conversation_id=request.conversation_id,
+                        loop_type=request.loop_type,
+                        context=request.context,
+                        metadata=request.metadata,
+                        timeout=request.timeout,
+                    )
+                    for request in batch
+                ),
+                return_exceptions=True,
+            )
+        except Exception as e:
+            return [e] * len(batch)
+
+    async def _async_enqueue(self, request: Dict[str, Any]) -> Any:
+        """将请求加入当前事件循环的批次，并等待批次提交结果"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        batch = self._pending.get(loop)
+        if batch is None:
+            batch = self._pending[loop] = []
+            loop.call_later(self.batch_window, self._flush, loop)
+        batch.append((request, future))
+        return await future
+
+    def _flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        """时间窗口结束，提交当前批次"""
+        batch = self._pending.pop(loop, None)
+        if not batch:
+            return
+        task = loop.create_task(self._async_submit(batch))
+        self._submit_tasks.add(task)
+        task.add_done_callback(self._submit_tasks.discard)
+
+    async def _async_submit(
+        self, batch: List[Tuple[Dict[str, Any], "asyncio.Future[Any]"]]
+    ) -> None:
+        results = await self.async_request_humanloop_many(
+            [request for request, _ in batch]
+        )
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
@@ -1,5 +1,6 @@
 from typing import Dict, Any, Optional, List, Type
 from types import TracebackType
+import functools
 import os
 import asyncio
 import aiohttp
@@ -21,10 +22,32 @@ from gohumanloop.core.interface import (
     HumanLoopStatus,
     HumanLoopResult,
 )
-from gohumanloop.utils import get_secret_from_env
+from gohumanloop.utils import get_secret_from_env, json_dumps, json_loads
 from gohumanloop.models.glh_model import GoHumanLoopConfig
 
 
+@functools.lru_cache(maxsize=1)
+def _get_package_version() -> str:
+    """获取gohumanloop版本号（进程内只解析一次元数据/pyproject.toml）"""
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+
+        try:
+            return str(version("gohumanloop"))
+        except PackageNotFoundError:
+            if tomli is not None:
+                root_dir = os.path.dirname(
+                    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+                )
+                pyproject_path = os.path.join(root_dir, "pyproject.toml")
+                with open(pyproject_path, "rb") as f:
+                    pyproject_data = tomli.load(f)
+                    return str(pyproject_data["project"]["version"])
+            return "0.1.0"
+    except (ImportError, FileNotFoundError, KeyError):
+        return "0.1.0"
+
+
 class GoHumanLoopManager(DefaultHumanLoopManager):
     """
     GoHumanLoop 官方平台的人机交互管理器
@@ -95,7 +118,9 @@ class GoHumanLoopManager(DefaultHumanLoopManager):
         self.default_provider_id = self.name
 
         # 存储最近同步时间
-        self._last_sync_time = time.time()
+        self._last_sync_time = time.monotonic()
+        # 同步元数据缓存（版本、客户端IP、UA 在进程内基本不变）
+        self._sync_metadata: Optional[Dict[str, Any]] = None
 
         # 同步间隔
         self.sync_interval = sync_interval
@@ -127,7 +152,7 @@ class GoHumanLoopManager(DefaultHumanLoopManager):
         Returns:
             GoHumanLoopProvider: GoHumanLoop 提供者实例
         """
-        provider = await self.async_get_provider(self.default_provider_id)
+        provider = self.get_provider(self.default_provider_id)
         # 添加类型转换确保返回正确类型
         assert isinstance(provider, GoHumanLoopProvider)
         return provider
@@ -186,7 +211,7 @@ class GoHumanLoopManager(DefaultHumanLoopManager):
 
         此方法收集所有任务的数据，并通过 API 发送到 GoHumanLoop 平台
         """
-        current_time = time.time()
+        current_time = time.monotonic()
 
         # 获取所有任务ID
         task_ids = list(self._task_conversations.keys())
@@ -194,7 +219,7 @@ class GoHumanLoopManager(DefaultHumanLoopManager):
         # 对每个任务进行数据同步
         for task_id in task_ids:
             # 获取任务相关的所有对话
-            conversations = await self.async_get_task_conversations(task_id)
+            conversations = self.get_task_conversations(task_id)
 
             # 收集任务数据
             task_data: Dict[str, Any] = {
@@ -206,9 +231,7 @@ class GoHumanLoopManager(DefaultHumanLoopManager):
             # 收集每个对话的数据
             for conversation_id in conversations:
                 # 获取对话中的所有请求
-                request_ids = await self.async_get_conversation_requests(
-                    conversation_id
-                )
+                request_ids = self.get_conversation_requests(conversation_id)
 
                 conversation_data: Dict[str, Any] = {
                     "conversation_id": conversation_id,
@@ -216,12 +239,11 @@ class GoHumanLoopManager(DefaultHumanLoopManager):
                     "requests": [],
                 }
 
-                # 收集每个请求的数据
-                for request_id in request_ids:
-                    result = await self._async_get_request_status(
-                        conversation_id, request_id
-                    )
-
+                # 并发查询后收集每个请求的数据
+                results = await self._async_get_request_statuses(
+                    conversation_id, request_ids
+                )
+                for request_id, result in zip(request_ids, results):
                     # 添加请求数据
                     conversation_data["requests"].append(
                         {
@@ -250,11 +272,11 @@ class GoHumanLoopManager(DefaultHumanLoopManager):
                     }
 
                     # 添加此对话中的已取消请求
-                    for request_id in cancel_info.get("request_ids", []):
-                        result = await self._async_get_request_status(
-                            conv_id, request_id, cancel_info.get("provider_id")
-                        )
-
+                    cancelled_ids = cancel_info.get("request_ids", [])
+                    results = await self._async_get_request_statuses(
+                        conv_id, cancelled_ids, cancel_info.get("provider_id")
+                    )
+                    for request_id, result in zip(cancelled_ids, results):
                         # 添加请求数据
                         cancelled_conv_data["requests"].append(
                             {
@@ -273,11 +295,7 @@ class GoHumanLoopManager(DefaultHumanLoopManager):
                     task_data["conversations"].append(cancelled_conv_data)
 
             # 添加 metadata 字段
-            task_data["metadata"] = {
-                "source": f"gohumanloop-{self._get_version()}",
-                "client_ip": self._get_client_ip(),
-                "user_agent": f"{platform.system()} {platform.release()}",
-            }
+            task_data["metadata"] = self._get_sync_metadata()
 
             # 发送数据到平台
             await self._async_send_task_data_to_platform(task_data)
@@ -291,7 +309,7 @@ class GoHumanLoopManager(DefaultHumanLoopManager):
 
         此方法收集所有任务的数据，并通过 API 发送到 GoHumanLoop 平台
         """
-        current_time = time.time()
+        current_time = time.monotonic()
 
         # 获取所有任务ID
         task_ids = list(self._task_conversations.keys())
@@ -321,12 +339,11 @@ class GoHumanLoopManager(DefaultHumanLoopManager):
                     "requests": [],
                 }
 
-                # 收集每个请求的数据
-                for request_id in request_ids:
-                    result = loop.run_until_complete(
-                        self._async_get_request_status(conversation_id, request_id)
-                    )
-
+                # 并发查询后收集每个请求的数据
+                results = loop.run_until_complete(
+                    self._async_get_request_statuses(conversation_id, request_ids)
+                )
+                for request_id, result in zip(request_ids, results):
                     # 添加请求数据
                     conversation_data["requests"].append(
                         {
@@ -355,13 +372,13 @@ class GoHumanLoopManager(DefaultHumanLoopManager):
                     }
 
                     # 添加此对话中的已取消请求
-                    for request_id in cancel_info.get("request_ids", []):
-                        result = loop.run_until_complete(
-                            self._async_get_request_status(
-                                conv_id, request_id, cancel_info.get("provider_id")
-                            )
+                    cancelled_ids = cancel_info.get("request_ids", [])
+                    results = loop.run_until_complete(
+                        self._async_get_request_statuses(
+                            conv_id, cancelled_ids, cancel_info.get("provider_id")
                         )
-
+                    )
+                    for request_id, result in zip(cancelled_ids, results):
                         # 添加请求数据
                         cancelled_conv_data["requests"].append(
                             {
@@ -380,11 +397,7 @@ class GoHumanLoopManager(DefaultHumanLoopManager):
                     task_data["conversations"].append(cancelled_conv_data)
 
             # 添加 metadata 字段
-            task_data["metadata"] = {
-                "source": f"gohumanloop-{self._get_version()}",
-                "client_ip": self._get_client_ip(),
-                "user_agent": f"{platform.system()} {platform.release()}",
-            }
+            task_data["metadata"] = self._get_sync_metadata()
 
             # 发送数据到平台
             loop.run_until_complete(self._async_send_task_data_to_platform(task_data))
@@ -409,7 +422,7 @@ class GoHumanLoopManager(DefaultHumanLoopManager):
             }
 
             # 使用 aiohttp 直接发送请求，而不依赖于 provider
-            async with aiohttp.ClientSession() as session:
+            async with aiohttp.ClientSession(json_serialize=json_dumps) as session:
                 try:
                     async with session.post(
                         url=url,
@@ -433,7 +446,7 @@ class GoHumanLoopManager(DefaultHumanLoopManager):
                             )
                             return
 
-                        response_data = await response.json()
+                        response_data = await response.json(loads=json_loads)
 
                         if not response_data.get("success", False):
                             error_msg = response_data.get("error", "未知错误")
@@ -443,6 +456,21 @@ class GoHumanLoopManager(DefaultHumanLoopManager):
         except Exception as e:
             print(f"发送任务数据到平台异常: {str(e)}")
 
+    def _get_sync_metadata(self) -> Dict[str, Any]:
+        """获取同步数据附带的客户端元数据，只在首次成功获取后缓存"""
+        metadata = self._sync_metadata
+        if metadata is None:
+            client_ip = self._get_client_ip()
+            metadata = {
+                "source": f"gohumanloop-{self._get_version()}",
+                "client_ip": client_ip,
+                "user_agent": f"{platform.system()} {platform.release()}",
+            }
+            # 获取IP失败时不缓存，下次同步重试
+            if client_ip != "127.0.0.1":
+                self._sync_metadata = metadata
+        return dict(metadata)
+
     def _get_client_ip(self) -> str:
         """获取客户端IP地址"""
         try:
@@ -455,23 +483,7 @@ class GoHumanLoopManager(DefaultHumanLoopManager):
 
     def _get_version(self) -> str:
         """获取gohumanloop版本号"""
-        try:
-            from importlib.metadata import version, PackageNotFoundError
-
-            try:
-                return str(version("gohumanloop"))
-            except PackageNotFoundError:
-                if tomli is not None:
-                    root_dir = os.path.dirname(
-                        os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-                    )
-                    pyproject_path = os.path.join(root_dir, "pyproject.toml")
-                    with open(pyproject_path, "rb") as f:
-                        pyproject_data = tomli.load(f)
-                        return str(pyproject_data["project"]["version"])
-                return "0.1.0"
-        except (ImportError, FileNotFoundError, KeyError):
-            return "0.1.0"
+        return _get_package_version()
 
     async def async_cancel_conversation(
         self, conversation_id: str, provider_id: Optional[str] = None
@@ -522,6 +534,34 @@ class GoHumanLoopManager(DefaultHumanLoopManager):
         provider = self.providers[provider_id]
         return await provider.async_check_request_status(conversation_id, request_id)
 
+    async def _async_get_request_statuses(
+        self,
+        conversation_id: str,
+        request_ids: List[str],
+        provider_id: Optional[str] = None,
+    ) -> List[HumanLoopResult]:
+        """
+        并发获取同一对话中多个请求的状态
+
+        Args:
+            conversation_id: 对话ID
+            request_ids: 请求ID列表
+            provider_id: 提供者ID（可选）
+
+        Returns:
+            List[HumanLoopResult]: 与 request_ids 顺序一致的状态结果
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    self._async_get_request_status(
+                        conversation_id, request_id, provider_id
+                    )
+                    for request_id in request_ids
+                )
+            )
+        )
+
     async def async_check_request_status(
         self, conversation_id: str, request_id: str, provider_id: Optional[str] = None
     ) -> HumanLoopResult:
@@ -529,25 +569,17 @@ class GoHumanLoopManager(DefaultHumanLoopManager):
         重写父类方法，增加数据同步操作
         """
         # 如果没有指定provider_id，尝试从存储的映射中获取
-        if provider_id is None:
-            stored_provider_id = self._conversation_provider.get(conversation_id)
-            provider_id = stored_provider_id or self.default_provider_id
-
-        if not provider_id or provider_id not in self.providers:
-            raise ValueError(f"Provider '{provider_id}' not found")
-
-        provider = self.providers[provider_id]
+        provider = self._resolve_conversation_provider(conversation_id, provider_id)
         result = await provider.async_check_request_status(conversation_id, request_id)
 
         # 如果有回调且状态不是等待或进行中
-        if result.status not in [HumanLoopStatus.PENDING]:
+        if result.status != HumanLoopStatus.PENDING:
             # 同步数据到平台
             await self.async_data_to_platform()
-            # 触发状态更新回调
-            if (conversation_id, request_id) in self._callbacks:
-                await self._async_trigger_update_callback(
-                    conversation_id, request_id, provider, result
-                )
+            # 触发状态更新回调（没有回调时直接返回）
+            await self._async_trigger_update_callback(
+                conversation_id, request_id, provider, result
+            )
 
         return result
 
@@ -589,6 +621,11 @@ class GoHumanLoopManager(DefaultHumanLoopManager):
         except Exception as e:
             print(f"最终异步数据同步失败: {str(e)}")
 
+        # 关闭提供者在当前事件循环中复用的 HTTP 会话
+        for provider in self.providers.values():
+            if isinstance(provider, GoHumanLoopProvider):
+                await provider.async_close()
+
     async def __aenter__(self) -> "GoHumanLoopManager":
         """实现异步上下文管理器协议的进入方法"""
         await self.async_start_sync_task()
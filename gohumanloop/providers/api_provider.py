@@ -1,12 +1,17 @@
 import asyncio
 import logging
-from typing import Dict, Any, Optional, Tuple
+import threading
+from contextlib import asynccontextmanager
+from types import TracebackType
+from typing import AsyncIterator, Dict, Any, Hashable, Optional, Set, Tuple, Type
 
 import aiohttp
 from pydantic import SecretStr
+from yarl import URL
 from concurrent.futures import ThreadPoolExecutor, Future
 from gohumanloop.core.interface import HumanLoopResult, HumanLoopStatus, HumanLoopType
 from gohumanloop.providers.base import BaseProvider
+from gohumanloop.utils import RESPONSE_ACCEPT, deadline, decode_response, json_dumps
 from gohumanloop.models.api_model import (
     APIResponse,
     HumanLoopRequestData,
@@ -19,6 +24,31 @@ from gohumanloop.models.api_model import (
 
 logger = logging.getLogger(__name__)
 
+# Statuses in which a request may still change
+_NON_TERMINAL = frozenset({HumanLoopStatus.PENDING, HumanLoopStatus.INPROGRESS})
+# API status strings mapped to enum members, skipping the enum constructor per poll
+_STATUS_BY_VALUE = {status.value: status for status in HumanLoopStatus}
+# Response fields copied from a status poll onto the stored request
+_RESPONSE_FIELDS = ("response", "feedback", "responded_by", "responded_at", "error")
+# Error bodies may be large HTML pages from a gateway, only this much is read
+_MAX_ERROR_BODY = 2048
+
+
+async def _read_error_message(response: aiohttp.ClientResponse) -> str:
+    """Get the error message of a failed response from the start of its body"""
+    # read() returns what is buffered, so collect chunks until the limit or EOF
+    body = b""
+    while len(body) < _MAX_ERROR_BODY:
+        chunk = await response.content.read(_MAX_ERROR_BODY - len(body))
+        if not chunk:
+            break
+        body += chunk
+    try:
+        error = decode_response(body, response.content_type).get("error")
+    except Exception:
+        error = None
+    return str(error) if error else f"API request failed: {response.status}"
+
 
 class APIProvider(BaseProvider):
     """API-based human-in-the-loop provider that supports integration with third-party service platforms
@@ -60,8 +90,22 @@ class APIProvider(BaseProvider):
 
         # Store the currently running polling tasks.
         self._poll_tasks: Dict[Tuple[str, str], Future] = {}
+        # Keep references to background cancel calls so they are not garbage collected
+        self._pending_cancels: Set[asyncio.Task] = set()
         # Create thread pool for background service execution
         self._executor = ThreadPoolExecutor(max_workers=10)
+        # Reusable HTTP sessions, only for event loops whose lifetime is known:
+        # the polling threads' own loops and loops entered with `async with provider`
+        self._sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+        self._sessions_lock = threading.Lock()
+        # (api_key, headers) pair, so headers are rebuilt if api_key is replaced
+        self._default_headers: Optional[
+            Tuple[Optional[SecretStr], Dict[str, str]]
+        ] = None
+        # Last ETag and response body per cache key, for conditional status polls
+        self._etag_cache: Dict[Hashable, Tuple[str, Dict[str, Any]]] = {}
+        # Parsed endpoint URLs, keyed by (api_base_url, endpoint)
+        self._urls: Dict[Tuple[str, str], URL] = {}
 
     def __del__(self) -> None:
         """析构函数，确保线程池被正确关闭"""
@@ -80,6 +124,112 @@ class APIProvider(BaseProvider):
             api_info += f"  Default Platform: {self.default_platform}\n"
         return f"{api_info}{base_str}"
 
+    def _get_default_headers(self) -> Dict[str, str]:
+        """Get the content-type and authentication headers, rebuilt only when api_key changes"""
+        cached = self._default_headers
+        if cached is None or cached[0] is not self.api_key:
+            default_headers = {
+                "Content-Type": "application/json",
+                "Accept": RESPONSE_ACCEPT,
+            }
+            # Add authentication information
+            if self.api_key:
+                default_headers[
+                    "Authorization"
+                ] = f"Bearer {self.api_key.get_secret_value()}"
+            cached = self._default_headers = (self.api_key, default_headers)
+        return cached[1]
+
+    def _get_url(self, endpoint: str) -> URL:
+        """Get the parsed URL for an endpoint, built once per api_base_url"""
+        key = (self.api_base_url, endpoint)
+        url = self._urls.get(key)
+        if url is None:
+            url = self._urls[key] = URL(f"{self.api_base_url}/{endpoint.lstrip('/')}")
+        return url
+
+    def _new_session(self) -> aiohttp.ClientSession:
+        """Create an HTTP session for the running event loop"""
+        # Status polls hit the same host for a long time, so keep
+        # connections and resolved addresses around between polls
+        connector = aiohttp.TCPConnector(ttl_dns_cache=300, keepalive_timeout=60)
+        return aiohttp.ClientSession(connector=connector, json_serialize=json_dumps)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the reusable HTTP session of the running event loop, creating it if needed
+
+        The caller is responsible for closing it with _async_close_loop_session
+        before the loop ends.
+        """
+        loop = asyncio.get_running_loop()
+        with self._sessions_lock:
+            session = self._sessions.get(loop)
+            if session is None or session.closed:
+                session = self._sessions[loop] = self._new_session()
+        return session
+
+    @asynccontextmanager
+    async def _session_scope(self) -> AsyncIterator[aiohttp.ClientSession]:
+        """Yield the running loop's reusable session, or a session closed on exit
+
+        Loops the provider does not manage (e.g. those of run_async_safely worker
+        threads) may end at any time, so no session outlives the request on them.
+        """
+        with self._sessions_lock:
+            session = self._sessions.get(asyncio.get_running_loop())
+        if session is not None and not session.closed:
+            yield session
+            return
+        async with self._new_session() as session:
+            yield session
+
+    async def _async_open_loop_session(self) -> None:
+        """Create the reusable HTTP session of the running event loop"""
+        self._get_session()
+
+    async def _async_close_loop_session(self) -> None:
+        """Close the reusable HTTP session of the running event loop"""
+        loop = asyncio.get_running_loop()
+        with self._sessions_lock:
+            session = self._sessions.pop(loop, None)
+        if session is not None and not session.closed:
+            await session.close()
+
+    async def async_close(self) -> None:
+        """Close all reusable HTTP sessions
+
+        Sessions of other event loops are closed on their own loop.
+        """
+        current = asyncio.get_running_loop()
+        with self._sessions_lock:
+            sessions = list(self._sessions.items())
+            self._sessions.clear()
+        for loop, session in sessions:
+            if session.closed:
+                continue
+            if loop is current:
+                await session.close()
+            elif loop.is_running():
+                await asyncio.wrap_future(
+                    asyncio.run_coroutine_threadsafe(session.close(), loop)
+                )
+            else:
+                logger.warning("Cannot close HTTP session of a stopped event loop")
+
+    async def __aenter__(self) -> "APIProvider":
+        """Reuse one HTTP session on the running loop until the context exits"""
+        self._get_session()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        """Close all reusable HTTP sessions"""
+        await self.async_close()
+
     async def _async_make_api_request(
         self,
         endpoint: str,
@@ -87,6 +237,7 @@ class APIProvider(BaseProvider):
         data: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, Any]] = None,
+        cache_key: Optional[Hashable] = None,
     ) -> Optional[Dict[str, Any]]:
         """Make API request
 
@@ -96,6 +247,8 @@ class APIProvider(BaseProvider):
             data: Request body data
             params: URL query parameters
             headers: Request headers
+            cache_key: If given, send If-None-Match with the ETag last seen for
+                this key and reuse the cached body on 304 Not Modified
 
         Returns:
             Dict[str, Any]: API response data
@@ -103,31 +256,25 @@ class APIProvider(BaseProvider):
         Raises:
             Exception: If API request fails
         """
-        url = f"{self.api_base_url}/{endpoint.lstrip('/')}"
-
-        # Prepare request headers
-        request_headers = {
-            "Content-Type": "application/json",
-        }
-        # Add authentication information
-        if self.api_key:
-            request_headers[
-                "Authorization"
-            ] = f"Bearer {self.api_key.get_secret_value()}"
-
-        # Merge custom headers
+        url = self._get_url(endpoint)
+
+        # Prepare request headers, merging custom headers into the cached defaults
+        request_headers = self._get_default_headers()
         if headers:
-            request_headers.update(headers)
+            request_headers = {**request_headers, **headers}
+        cached = self._etag_cache.get(cache_key) if cache_key is not None else None
+        if cached:
+            request_headers = {**request_headers, "If-None-Match": cached[0]}
 
         # Prepare request data
         json_data = None
         if data:
             json_data = data
 
-        # Send request
-        for attempt in range(self.max_retries):
-            try:
-                async with aiohttp.ClientSession() as session:
+        # Send request, reusing the session of a loop this provider manages
+        async with self._session_scope() as session:
+            for attempt in range(self.max_retries):
+                try:
                     async with session.request(
                         method=method,
                         url=url,
@@ -136,12 +283,11 @@ class APIProvider(BaseProvider):
                         headers=request_headers,
                         timeout=self.request_timeout,
                     ) as response:
-                        response_data: Dict[str, Any] = await response.json()
+                        if cached and response.status == 304:
+                            return cached[1]
                         # Check response status
                         if response.status >= 400:
-                            error_msg = response_data.get(
-                                "error", f"API request failed: {response.status}"
-                            )
+                            error_msg = await _read_error_message(response)
                             logger.error(f"API request failed: {error_msg}")
 
                             # Retry if not the last attempt
@@ -153,21 +299,28 @@ class APIProvider(BaseProvider):
 
                             raise Exception(error_msg)
 
+                        # Decode the raw body directly (MessagePack or JSON), skipping the intermediate str
+                        response_data: Dict[str, Any] = decode_response(
+                            await response.read(), response.content_type
+                        )
+                        etag = response.headers.get("ETag")
+                        if cache_key is not None and etag:
+                            self._etag_cache[cache_key] = (etag, response_data)
                         return response_data
-            except asyncio.TimeoutError:
-                logger.warning(
-                    f"API request timeout (attempt {attempt+1}/{self.max_retries})"
-                )
-                if attempt < self.max_retries - 1:
-                    await asyncio.sleep(1 * (attempt + 1))
-                    continue
-                raise Exception("API request timeout")
-            except Exception as e:
-                logger.error(f"API request error: {str(e)}")
-                if attempt < self.max_retries - 1:
-                    await asyncio.sleep(1 * (attempt + 1))
-                    continue
-                raise
+                except asyncio.TimeoutError:
+                    logger.warning(
+                        f"API request timeout (attempt {attempt+1}/{self.max_retries})"
+                    )
+                    if attempt < self.max_retries - 1:
+                        await asyncio.sleep(1 * (attempt + 1))
+                        continue
+                    raise Exception("API request timeout")
+                except Exception as e:
+                    logger.error(f"API request error: {str(e)}")
+                    if attempt < self.max_retries - 1:
+                        await asyncio.sleep(1 * (attempt + 1))
+                        continue
+                    raise
 
         return None
 
@@ -243,7 +396,7 @@ class APIProvider(BaseProvider):
 
             # Check API response
             response_data = response or {}
-            api_response = APIResponse(**response_data)
+            api_response = APIResponse.model_validate(response_data)
             if not api_response.success:
                 error_msg = (
                     api_response.error or "API request failed without error message"
@@ -303,6 +456,8 @@ class APIProvider(BaseProvider):
         asyncio.set_event_loop(loop)
 
         try:
+            # The provider owns this loop, so its requests share one session
+            loop.run_until_complete(self._async_open_loop_session())
             # Run interaction processing in the new event loop
             loop.run_until_complete(
                 self._async_poll_request_status_with_timeout(
@@ -310,10 +465,10 @@ class APIProvider(BaseProvider):
                 )
             )
         finally:
+            loop.run_until_complete(self._async_close_loop_session())
             loop.close()
             # Remove from task dictionary
-            if (conversation_id, request_id) in self._poll_tasks:
-                del self._poll_tasks[(conversation_id, request_id)]
+            self._poll_tasks.pop((conversation_id, request_id), None)
 
     async def async_check_request_status(
         self, conversation_id: str, request_id: str
@@ -351,12 +506,16 @@ class APIProvider(BaseProvider):
 
         return result
 
-    async def async_cancel_request(self, conversation_id: str, request_id: str) -> bool:
+    async def async_cancel_request(
+        self, conversation_id: str, request_id: str, *, wait: bool = True
+    ) -> bool:
         """Cancel human-in-the-loop request
 
         Args:
             conversation_id: Conversation identifier for multi-turn dialogue
             request_id: Request identifier for specific interaction request
+            wait: Wait for the API to confirm the cancellation. If False, the request is
+                cancelled locally and the API call runs in the background
 
         Returns:
             bool: Whether cancellation was successful, True for success, False for failure
@@ -377,6 +536,31 @@ class APIProvider(BaseProvider):
             logger.error("Cancel request failed: Platform information not found")
             return False
 
+        if wait:
+            return await self._async_remote_cancel_request(
+                conversation_id, request_id, platform
+            )
+
+        task = asyncio.create_task(
+            self._async_remote_cancel_request(conversation_id, request_id, platform)
+        )
+        self._pending_cancels.add(task)
+        task.add_done_callback(self._pending_cancels.discard)
+        return True
+
+    async def _async_remote_cancel_request(
+        self, conversation_id: str, request_id: str, platform: str
+    ) -> bool:
+        """Send the cancellation of a request to the API and stop polling it
+
+        Args:
+            conversation_id: Conversation identifier
+            request_id: Request identifier
+            platform: Platform identifier
+
+        Returns:
+            bool: Whether the API confirmed the cancellation
+        """
         try:
             # Send API request to cancel request
             cancel_data = HumanLoopCancelData(
@@ -391,7 +575,7 @@ class APIProvider(BaseProvider):
 
             # Check API response
             response_data = response or {}
-            api_response = APIResponse(**response_data)
+            api_response = APIResponse.model_validate(response_data)
             if not api_response.success:
                 error_msg = (
                     api_response.error or "Cancel request failed without error message"
@@ -400,9 +584,9 @@ class APIProvider(BaseProvider):
                 return False
 
             # Cancel polling task
-            if (conversation_id, request_id) in self._poll_tasks:
-                self._poll_tasks[(conversation_id, request_id)].cancel()
-                del self._poll_tasks[(conversation_id, request_id)]
+            task = self._poll_tasks.pop((conversation_id, request_id), None)
+            if task is not None:
+                task.cancel()
 
             return True
 
@@ -453,7 +637,7 @@ class APIProvider(BaseProvider):
 
             # Check API response
             response_data = response or {}
-            api_response = APIResponse(**response_data)
+            api_response = APIResponse.model_validate(response_data)
             if not api_response.success:
                 error_msg = (
                     api_response.error
@@ -464,9 +648,9 @@ class APIProvider(BaseProvider):
 
             # Cancel all polling tasks
             for request_id in request_ids:
-                if (conversation_id, request_id) in self._poll_tasks:
-                    self._poll_tasks[(conversation_id, request_id)].cancel()
-                    del self._poll_tasks[(conversation_id, request_id)]
+                task = self._poll_tasks.pop((conversation_id, request_id), None)
+                if task is not None:
+                    task.cancel()
 
             return True
 
@@ -556,7 +740,7 @@ class APIProvider(BaseProvider):
 
             # Check API response
             response_data = response or {}
-            api_response = APIResponse(**response_data)
+            api_response = APIResponse.model_validate(response_data)
             if not api_response.success:
                 error_msg = (
                     api_response.error
@@ -619,16 +803,8 @@ class APIProvider(BaseProvider):
         """
 
         try:
-            if timeout:
-                # 使用 wait_for 设置超时
-                await asyncio.wait_for(
-                    self._async_poll_request_status(
-                        conversation_id, request_id, platform
-                    ),
-                    timeout=timeout,
-                )
-            else:
-                # 无超时限制
+            # timeout 为空时不限制时间
+            async with deadline(timeout):
                 await self._async_poll_request_status(
                     conversation_id, request_id, platform
                 )
@@ -639,9 +815,12 @@ class APIProvider(BaseProvider):
             if request_info and request_info.get("status") == HumanLoopStatus.PENDING:
                 request_info["status"] = HumanLoopStatus.EXPIRED
                 request_info["error"] = "Request timed out"
+                self._notify_status_change(conversation_id, request_id)
                 logger.info(
                     f"\nRequest {request_id} has timed out after {timeout} seconds"
                 )
+        finally:
+            self._etag_cache.pop((conversation_id, request_id), None)
 
     async def _async_poll_request_status(
         self, conversation_id: str, request_id: str, platform: str
@@ -664,7 +843,7 @@ class APIProvider(BaseProvider):
 
             # Stop polling if request is in final status
             status = request_info.get("status")
-            if status not in [HumanLoopStatus.PENDING, HumanLoopStatus.INPROGRESS]:
+            if status not in _NON_TERMINAL:
                 return
 
             # Send API request to get status
@@ -675,12 +854,15 @@ class APIProvider(BaseProvider):
             ).model_dump()
 
             response = await self._async_make_api_request(
-                endpoint="v1/humanloop/status", method="GET", params=params
+                endpoint="v1/humanloop/status",
+                method="GET",
+                params=params,
+                cache_key=(conversation_id, request_id),
             )
 
             # Parse response
             response_data = response or {}
-            status_response = HumanLoopStatusResponse(**response_data)
+            status_response = HumanLoopStatusResponse.model_validate(response_data)
 
             # Log error but continue polling if request fails
             if not status_response.success:
@@ -689,36 +871,27 @@ class APIProvider(BaseProvider):
                 continue
 
             # Parse status
-            try:
-                new_status = HumanLoopStatus(status_response.status)
-            except ValueError:
+            new_status = _STATUS_BY_VALUE.get(status_response.status)
+            if new_status is None:
                 logger.warning(
                     f"Unknown status value: {status_response.status}, using PENDING"
                 )
                 new_status = HumanLoopStatus.PENDING
 
             # Update request information
-            request_key = (conversation_id, request_id)
-            if request_key in self._requests:
-                self._requests[request_key]["status"] = new_status
+            request_info = self._get_request(conversation_id, request_id)
+            if request_info is not None:
+                request_info["status"] = new_status
 
                 # Update response data
-                for field in [
-                    "response",
-                    "feedback",
-                    "responded_by",
-                    "responded_at",
-                    "error",
-                ]:
+                for field in _RESPONSE_FIELDS:
                     value = getattr(status_response, field, None)
                     if value is not None:
-                        self._requests[request_key][field] = value
+                        request_info[field] = value
+                self._notify_status_change(conversation_id, request_id)
 
                 # Stop polling if request is in final status
-                if new_status not in [
-                    HumanLoopStatus.PENDING,
-                    HumanLoopStatus.INPROGRESS,
-                ]:
+                if new_status not in _NON_TERMINAL:
                     return
 
             # Wait for next polling interval
@@ -1,6 +1,8 @@
 from abc import ABC
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Optional, List, Sequence, Tuple
+import asyncio
 import json
+import threading
 import uuid
 from datetime import datetime
 from collections import defaultdict
@@ -9,12 +11,36 @@ from gohumanloop.utils import run_async_safely
 
 from gohumanloop.core.interface import (
     HumanLoopProvider,
+    HumanLoopRequest,
     HumanLoopResult,
     HumanLoopStatus,
     HumanLoopType,
 )
 
 
+# Statuses in which a request may still change
+_NON_TERMINAL = frozenset({HumanLoopStatus.PENDING, HumanLoopStatus.INPROGRESS})
+
+
+def _resolve_waiter(future: asyncio.Future) -> None:
+    """Mark a status waiter as done unless it was already cancelled"""
+    if not future.done():
+        future.set_result(None)
+
+
+def _batch_error_result(
+    request: HumanLoopRequest, error: BaseException
+) -> HumanLoopResult:
+    """Result reported for a failed request inside a batch"""
+    return HumanLoopResult(
+        conversation_id=request.conversation_id,
+        request_id=request.request_id or "",
+        loop_type=request.loop_type,
+        status=HumanLoopStatus.ERROR,
+        error=str(error),
+    )
+
+
 class BaseProvider(HumanLoopProvider, ABC):
     """Base implementation of human-in-the-loop provider"""
 
@@ -32,6 +58,11 @@ class BaseProvider(HumanLoopProvider, ABC):
         self._conversations: Dict[str, Dict[str, Any]] = {}
         # For quick lookup of requests in conversations
         self._conversation_requests: defaultdict[str, List[str]] = defaultdict(list)
+        # Coroutines waiting for a request status change, possibly on other threads' loops
+        self._status_waiters: Dict[
+            Tuple[str, str], List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]]
+        ] = {}
+        self._status_waiters_lock = threading.Lock()
 
         self.prompt_template = self.config.get("prompt_template", "{context}")
 
@@ -40,9 +71,7 @@ class BaseProvider(HumanLoopProvider, ABC):
         total_conversations = len(self._conversations)
         total_requests = len(self._requests)
         active_requests = sum(
-            1
-            for req in self._requests.values()
-            if req["status"] in [HumanLoopStatus.PENDING, HumanLoopStatus.INPROGRESS]
+            1 for req in self._requests.values() if req["status"] in _NON_TERMINAL
         )
 
         return (
@@ -59,6 +88,56 @@ class BaseProvider(HumanLoopProvider, ABC):
         """Generates a unique request ID"""
         return str(uuid.uuid4())
 
+    def _notify_status_change(self, conversation_id: str, request_id: str) -> None:
+        """Wake up coroutines waiting for a status change of the request
+
+        Safe to call from any thread, must be called after the status is updated.
+        """
+        with self._status_waiters_lock:
+            waiters = self._status_waiters.pop((conversation_id, request_id), [])
+
+        for loop, future in waiters:
+            try:
+                loop.call_soon_threadsafe(_resolve_waiter, future)
+            except RuntimeError:
+                # The waiting event loop has already been closed
+                pass
+
+    async def async_wait_for_status_change(
+        self,
+        conversation_id: str,
+        request_id: str,
+        status: HumanLoopStatus,
+    ) -> None:
+        """Wait until the request status is no longer `status`
+
+        Returns immediately if the request does not exist or its status already differs.
+
+        Args:
+            conversation_id: Conversation identifier
+            request_id: Request identifier
+            status: Status last observed by the caller
+        """
+        request_key = (conversation_id, request_id)
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+
+        with self._status_waiters_lock:
+            request_info = self._requests.get(request_key)
+            if not request_info or request_info.get("status") != status:
+                return
+            self._status_waiters.setdefault(request_key, []).append((loop, future))
+
+        try:
+            await future
+        finally:
+            with self._status_waiters_lock:
+                waiters = self._status_waiters.get(request_key)
+                if waiters and (loop, future) in waiters:
+                    waiters.remove((loop, future))
+                    if not waiters:
+                        del self._status_waiters[request_key]
+
     def _update_request_status_error(
         self,
         conversation_id: str,
@@ -66,10 +145,11 @@ class BaseProvider(HumanLoopProvider, ABC):
         error: Optional[str] = None,
     ) -> None:
         """Update request status"""
-        request_key = (conversation_id, request_id)
-        if request_key in self._requests:
-            self._requests[request_key]["status"] = HumanLoopStatus.ERROR
-            self._requests[request_key]["error"] = error
+        request_info = self._get_request(conversation_id, request_id)
+        if request_info is not None:
+            request_info["status"] = HumanLoopStatus.ERROR
+            request_info["error"] = error
+            self._notify_status_change(conversation_id, request_id)
 
     def _store_request(
         self,
@@ -82,13 +162,15 @@ class BaseProvider(HumanLoopProvider, ABC):
         timeout: Optional[int],
     ) -> None:
         """Store request information"""
+        # One timestamp serves both the request and a newly created conversation
+        created_at = datetime.now().isoformat()
         # Store request information using tuple (conversation_id, request_id) as key
         self._requests[(conversation_id, request_id)] = {
             "task_id": task_id,
             "loop_type": loop_type,
             "context": context,
             "metadata": metadata,
-            "created_at": datetime.now().isoformat(),
+            "created_at": created_at,
             "status": HumanLoopStatus.PENDING,
             "timeout": timeout,
         }
@@ -98,7 +180,7 @@ class BaseProvider(HumanLoopProvider, ABC):
             self._conversations[conversation_id] = {
                 "task_id": task_id,
                 "latest_request_id": None,
-                "created_at": datetime.now().isoformat(),
+                "created_at": created_at,
             }
 
         # Add request to conversation request list
@@ -183,6 +265,58 @@ class BaseProvider(HumanLoopProvider, ABC):
         )
         return result
 
+    async def async_request_humanloop_batch(
+        self, requests: Sequence[HumanLoopRequest]
+    ) -> List[HumanLoopResult]:
+        """Request several human-in-the-loop interactions at once
+
+        The default implementation calls async_request_humanloop concurrently.
+        Providers able to send many requests in one round trip should override it.
+        A failed request yields an ERROR result without affecting the others.
+
+        Args:
+            requests: Requests to submit
+
+        Returns:
+            List[HumanLoopResult]: Results in the same order as requests
+        """
+        results = await asyncio.gather(
+            *(
+                self.async_request_humanloop(
+                    task_id=request.task_id,
+                    conversation_id=request.conversation_id,
+                    loop_type=request.loop_type,
+                    context=request.context,
+                    metadata=request.metadata,
+                    timeout=request.timeout,
+                )
+                for request in requests
+            ),
+            return_exceptions=True,
+        )
+        return [
+            _batch_error_result(request, result)
+            if isinstance(result, BaseException)
+            else result
+            for request, result in zip(requests, results)
+        ]
+
+    def request_humanloop_batch(
+        self, requests: Sequence[HumanLoopRequest]
+    ) -> List[HumanLoopResult]:
+        """Request several human-in-the-loop interactions at once (synchronous version)
+
+        Args:
+            requests: Requests to submit
+
+        Returns:
+            List[HumanLoopResult]: Results in the same order as requests
+        """
+        results: List[HumanLoopResult] = run_async_safely(
+            self.async_request_humanloop_batch(requests)
+        )
+        return results
+
     async def async_check_request_status(
         self, conversation_id: str, request_id: str
     ) -> HumanLoopResult:
@@ -288,10 +422,11 @@ class BaseProvider(HumanLoopProvider, ABC):
             bool: Whether cancellation was successful, True indicates success, False indicates failure
         """
 
-        request_key = (conversation_id, request_id)
-        if request_key in self._requests:
+        request_info = self._get_request(conversation_id, request_id)
+        if request_info is not None:
             # Update request status to cancelled
-            self._requests[request_key]["status"] = HumanLoopStatus.CANCELLED
+            request_info["status"] = HumanLoopStatus.CANCELLED
+            self._notify_status_change(conversation_id, request_id)
             return True
         return False
 
@@ -329,15 +464,14 @@ class BaseProvider(HumanLoopProvider, ABC):
         # Cancel all requests in the conversation
         success = True
         for request_id in self._get_conversation_requests(conversation_id):
-            request_key = (conversation_id, request_id)
-            if request_key in self._requests:
+            # One lookup per request: every access to the thread-safe dict takes its lock
+            request_info = self._get_request(conversation_id, request_id)
+            if request_info is not None:
                 # Update request status to cancelled
                 # Only requests in intermediate states (PENDING/IN_PROGRESS) can be cancelled
-                if self._requests[request_key]["status"] in [
-                    HumanLoopStatus.PENDING,
-                    HumanLoopStatus.INPROGRESS,
-                ]:
-                    self._requests[request_key]["status"] = HumanLoopStatus.CANCELLED
+                if request_info["status"] in _NON_TERMINAL:
+                    request_info["status"] = HumanLoopStatus.CANCELLED
+                    self._notify_status_change(conversation_id, request_id)
             else:
                 success = False
 
@@ -435,15 +569,13 @@ class BaseProvider(HumanLoopProvider, ABC):
         """
         conversation_history = []
         for request_id in self._get_conversation_requests(conversation_id):
-            request_key = (conversation_id, request_id)
-            if request_key in self._requests:
-                request_info = self._requests[request_key]
+            request_info = self._get_request(conversation_id, request_id)
+            if request_info is not None:
+                status = request_info.get("status")
                 conversation_history.append(
                     {
                         "request_id": request_id,
-                        "status": request_info.get("status").value
-                        if request_info.get("status")
-                        else None,
+                        "status": status.value if status else None,
                         "context": request_info.get("context"),
                         "response": request_info.get("response"),
                         "responded_by": request_info.get("responded_by"),
@@ -2,6 +2,8 @@ import os
 import re
 import asyncio
 import smtplib
+import threading
+import time
 from imapclient import IMAPClient  # type: ignore
 import email.mime.multipart
 import email.mime.text
@@ -9,17 +11,20 @@ from email.header import decode_header
 from email import message_from_bytes
 from email.message import Message
 import logging
-from typing import Dict, Any, Optional, Tuple
+from typing import Callable, Dict, Any, Optional, Tuple
 from datetime import datetime
 from pydantic import SecretStr
 from concurrent.futures import ThreadPoolExecutor, Future
 
 from gohumanloop.core.interface import HumanLoopResult, HumanLoopStatus, HumanLoopType
 from gohumanloop.providers.base import BaseProvider
-from gohumanloop.utils import get_secret_from_env
+from gohumanloop.utils import deadline, get_secret_from_env
 
 logger = logging.getLogger(__name__)
 
+# Servers may drop IDLE connections after 30 minutes (RFC 2177), so re-issue IDLE before that
+_MAX_IDLE_SECONDS = 29 * 60
+
 
 class EmailProvider(BaseProvider):
     """Email-based human-in-the-loop provider implementation"""
@@ -232,16 +237,8 @@ class EmailProvider(BaseProvider):
         """
 
         try:
-            if timeout:
-                # 使用 wait_for 设置超时
-                await asyncio.wait_for(
-                    self._async_check_emails(
-                        conversation_id, request_id, recipient_email, subject
-                    ),
-                    timeout=timeout,
-                )
-            else:
-                # 无超时限制
+            # timeout 为空时不限制时间
+            async with deadline(timeout):
                 await self._async_check_emails(
                     conversation_id, request_id, recipient_email, subject
                 )
@@ -252,6 +249,7 @@ class EmailProvider(BaseProvider):
             if request_info and request_info.get("status") == HumanLoopStatus.PENDING:
                 request_info["status"] = HumanLoopStatus.EXPIRED
                 request_info["error"] = "Request timed out"
+                self._notify_status_change(conversation_id, request_id)
                 logger.info(
                     f"\nRequest {request_id} has timed out after {timeout} seconds"
                 )
@@ -268,29 +266,41 @@ class EmailProvider(BaseProvider):
             subject: Email subject
         """
         request_key = (conversation_id, request_id)
+        # 超时或取消时通知执行器中的 IMAP 会话退出
+        stop = threading.Event()
+
+        def should_stop() -> bool:
+            request_info = self._requests.get(request_key)
+            return (
+                stop.is_set()
+                or request_info is None
+                or request_info["status"] != HumanLoopStatus.PENDING
+            )
 
-        while request_key in self._requests and self._requests[request_key][
-            "status"
-        ] in [HumanLoopStatus.PENDING]:
-            try:
-                # 使用异步方式检查邮件
-                loop = asyncio.get_event_loop()
-                email_msg = await loop.run_in_executor(
-                    None, self._fetch_emails_sync, subject, recipient_email
-                )
-
-                await self._process_email_response(
-                    conversation_id, request_id, email_msg
-                )
-
-                # 等待一段时间后再次检查
-                await asyncio.sleep(self.check_interval)
-            except Exception as e:
-                logger.error(f"Failed to check emails: {str(e)}", exc_info=True)
-                self._update_request_status_error(
-                    conversation_id, request_id, f"Failed to check emails: {str(e)}"
-                )
-                break
+        try:
+            while not should_stop():
+                try:
+                    # 在执行器中保持 IMAP 连接，等待新邮件到达
+                    loop = asyncio.get_event_loop()
+                    email_msg = await loop.run_in_executor(
+                        None,
+                        self._fetch_emails_sync,
+                        subject,
+                        recipient_email,
+                        should_stop,
+                    )
+
+                    await self._process_email_response(
+                        conversation_id, request_id, email_msg
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to check emails: {str(e)}", exc_info=True)
+                    self._update_request_status_error(
+                        conversation_id, request_id, f"Failed to check emails: {str(e)}"
+                    )
+                    break
+        finally:
+            stop.set()
 
     def _decode_email_header(self, header_value: str) -> str:
         """Parse email header information and handle potential encoding issues
@@ -313,16 +323,28 @@ class EmailProvider(BaseProvider):
         return result
 
     def _fetch_emails_sync(
-        self, subject: str, sender_email: Optional[str] = None
+        self,
+        subject: str,
+        sender_email: Optional[str] = None,
+        should_stop: Optional[Callable[[], bool]] = None,
     ) -> Any:
-        """Synchronously fetch emails (runs in executor)
+        """Synchronously wait for a matching unread email (runs in executor)
+
+        Keeps one IMAP connection open. Between searches it waits for new mail with
+        IMAP IDLE, or sleeps check_interval seconds if the server lacks IDLE.
+
+        Each waiting request holds its own connection, so up to 10 (the size of
+        the email check executor) can be open at once. Some servers limit
+        concurrent IMAP connections per account to fewer than that.
 
         Args:
             subject: Email subject
             sender_email: Sender email address (optional filter)
+            should_stop: Called between searches, stop waiting once it returns True.
+                If None, search only once
 
         Returns:
-            List[email.message.Message]: List of matching emails
+            Optional[email.message.Message]: The matching email, or None if stopped
         """
 
         # 连接到IMAP服务器
@@ -349,36 +371,68 @@ class EmailProvider(BaseProvider):
 
             # 选择收件箱
             client.select_folder("INBOX")
+            supports_idle = client.has_capability("IDLE")
+
+            while True:
+                email_message = self._search_email(client, subject, sender_email)
+                if email_message is not None or should_stop is None or should_stop():
+                    return email_message
+
+                if supports_idle:
+                    # 服务器推送新邮件通知后立即重新搜索，超时后也搜索一次以防漏掉
+                    client.idle()
+                    try:
+                        client.idle_check(
+                            timeout=min(self.check_interval, _MAX_IDLE_SECONDS)
+                        )
+                    finally:
+                        client.idle_done()
+                else:
+                    time.sleep(self.check_interval)
+
+                if should_stop():
+                    return None
+
+    def _search_email(
+        self, client: Any, subject: str, sender_email: Optional[str]
+    ) -> Optional[Message]:
+        """Find the first unread email matching the subject and sender, marking it read
+
+        Args:
+            client: Logged-in IMAP client with INBOX selected
+            subject: Email subject
+            sender_email: Sender email address (optional filter)
 
-            # 执行搜索
-            messages = client.search("UNSEEN")
+        Returns:
+            Optional[email.message.Message]: The matching email, if any
+        """
+        # 执行搜索
+        messages = client.search("UNSEEN")
 
-            if not messages:
-                logger.warning("No unread emails found")
-                return None
+        if not messages:
+            logger.warning("No unread emails found")
+            return None
 
-            # 获取邮件内容
-            for uid, message_data in client.fetch(messages, "RFC822").items():
-                email_message = message_from_bytes(message_data[b"RFC822"])
+        # 获取邮件内容
+        for uid, message_data in client.fetch(messages, "RFC822").items():
+            email_message = message_from_bytes(message_data[b"RFC822"])
 
-                # 使用通用方法解析发件人
-                from_header = self._decode_email_header(email_message.get("From", ""))
+            # 使用通用方法解析发件人
+            from_header = self._decode_email_header(email_message.get("From", ""))
 
-                # 使用通用方法解析主题
-                email_subject = self._decode_email_header(
-                    email_message.get("Subject", "")
-                )
+            # 使用通用方法解析主题
+            email_subject = self._decode_email_header(email_message.get("Subject", ""))
 
-                # 检查是否匹配发件人和主题条件
-                if (sender_email and sender_email not in from_header) or (
-                    subject and subject not in email_subject
-                ):
-                    continue
+            # 检查是否匹配发件人和主题条件
+            if (sender_email and sender_email not in from_header) or (
+                subject and subject not in email_subject
+            ):
+                continue
 
-                # 将邮件标记为已读
-                client.set_flags(uid, [b"\\Seen"])
-                return email_message
-            return None
+            # 将邮件标记为已读
+            client.set_flags(uid, [b"\\Seen"])
+            return email_message
+        return None
 
     async def _process_email_response(
         self, conversation_id: str, request_id: str, email_msg: Message
@@ -530,6 +584,7 @@ class EmailProvider(BaseProvider):
                 "responded_at": datetime.now().isoformat(),
             }
         )
+        self._notify_status_change(conversation_id, request_id)
 
     def _format_email_body(
         self, body: str, loop_type: HumanLoopType, subject: str
@@ -857,8 +912,7 @@ class EmailProvider(BaseProvider):
             # Close event loop
             loop.close()
             # Remove from task dictionary
-            if (conversation_id, request_id) in self._mail_check_tasks:
-                del self._mail_check_tasks[(conversation_id, request_id)]
+            self._mail_check_tasks.pop((conversation_id, request_id), None)
 
     async def async_check_request_status(
         self, conversation_id: str, request_id: str
@@ -1050,9 +1104,9 @@ class EmailProvider(BaseProvider):
         """
         # 取消邮件检查任务
         request_key = (conversation_id, request_id)
-        if request_key in self._mail_check_tasks:
-            self._mail_check_tasks[request_key].cancel()
-            del self._mail_check_tasks[request_key]
+        task = self._mail_check_tasks.pop(request_key, None)
+        if task is not None:
+            task.cancel()
 
         # 调用父类方法取消请求
         return await super().async_cancel_request(conversation_id, request_id)
@@ -1069,9 +1123,9 @@ class EmailProvider(BaseProvider):
         # 取消所有相关的邮件检查任务
         for request_id in self._get_conversation_requests(conversation_id):
             request_key = (conversation_id, request_id)
-            if request_key in self._mail_check_tasks:
-                self._mail_check_tasks[request_key].cancel()
-                del self._mail_check_tasks[request_key]
+            task = self._mail_check_tasks.pop(request_key, None)
+            if task is not None:
+                task.cancel()
 
         # 调用父类方法取消对话
         return await super().async_cancel_conversation(conversation_id)
@@ -5,6 +5,7 @@ from datetime import datetime
 
 from gohumanloop.core.interface import HumanLoopResult, HumanLoopStatus, HumanLoopType
 from gohumanloop.providers.base import BaseProvider
+from gohumanloop.utils import deadline
 
 
 class TerminalProvider(BaseProvider):
@@ -100,14 +101,8 @@ class TerminalProvider(BaseProvider):
     ) -> None:
         """Process terminal interaction with timeout functionality"""
         try:
-            if timeout:
-                # Set timeout using wait_for
-                await asyncio.wait_for(
-                    self._process_terminal_interaction(conversation_id, request_id),
-                    timeout=timeout,
-                )
-            else:
-                # No timeout limit
+            # No time limit when timeout is None
+            async with deadline(timeout):
                 await self._process_terminal_interaction(conversation_id, request_id)
 
         except asyncio.TimeoutError:
@@ -116,6 +111,7 @@ class TerminalProvider(BaseProvider):
             if request_info and request_info.get("status") == HumanLoopStatus.PENDING:
                 request_info["status"] = HumanLoopStatus.EXPIRED
                 request_info["error"] = "Request timed out"
+                self._notify_status_change(conversation_id, request_id)
                 print(f"\nRequest {request_id} has timed out after {timeout} seconds")
 
     def _run_async_terminal_interaction(
@@ -136,8 +132,7 @@ class TerminalProvider(BaseProvider):
         finally:
             loop.close()
             # Remove from task dictionary
-            if (conversation_id, request_id) in self._terminal_input_tasks:
-                del self._terminal_input_tasks[(conversation_id, request_id)]
+            self._terminal_input_tasks.pop((conversation_id, request_id), None)
 
     async def async_check_request_status(
         self, conversation_id: str, request_id: str
@@ -313,6 +308,7 @@ class TerminalProvider(BaseProvider):
         request_info["response"] = response_data
         request_info["responded_by"] = "terminal_user"
         request_info["responded_at"] = datetime.now().isoformat()
+        self._notify_status_change(conversation_id, request_id)
 
         print(f"\nYour decision has been recorded: {status.value}")
 
@@ -337,6 +333,7 @@ class TerminalProvider(BaseProvider):
         request_info["response"] = response
         request_info["responded_by"] = "terminal_user"
         request_info["responded_at"] = datetime.now().isoformat()
+        self._notify_status_change(conversation_id, request_id)
 
         print("\nYour information has been recorded")
 
@@ -368,6 +365,7 @@ class TerminalProvider(BaseProvider):
         request_info["response"] = response
         request_info["responded_by"] = "terminal_user"
         request_info["responded_at"] = datetime.now().isoformat()
+        self._notify_status_change(conversation_id, request_id)
 
         print("\nYour response has been recorded")
 
@@ -383,9 +381,9 @@ class TerminalProvider(BaseProvider):
                  False indicates cancellation failed
         """
         request_key = (conversation_id, request_id)
-        if request_key in self._terminal_input_tasks:
-            self._terminal_input_tasks[request_key].cancel()
-            del self._terminal_input_tasks[request_key]
+        task = self._terminal_input_tasks.pop(request_key, None)
+        if task is not None:
+            task.cancel()
 
         # 调用父类方法取消请求
         return await super().async_cancel_request(conversation_id, request_id)
@@ -402,9 +400,9 @@ class TerminalProvider(BaseProvider):
         # 取消所有相关的邮件检查任务
         for request_id in self._get_conversation_requests(conversation_id):
             request_key = (conversation_id, request_id)
-            if request_key in self._terminal_input_tasks:
-                self._terminal_input_tasks[request_key].cancel()
-                del self._terminal_input_tasks[request_key]
+            task = self._terminal_input_tasks.pop(request_key, None)
+            if task is not None:
+                task.cancel()
 
         # 调用父类方法取消对话
         return await super().async_cancel_conversation(conversation_id)
@@ -1,5 +1,25 @@
-from .utils import run_async_safely, get_secret_from_env
-from .context_formatter import generate_function_summary
+from .utils import (
+    BackgroundEventLoop,
+    RESPONSE_ACCEPT,
+    deadline,
+    decode_response,
+    run_async_safely,
+    get_secret_from_env,
+    json_dumps,
+    json_loads,
+)
+from .context_formatter import generate_function_summary, make_function_summary
 
 
-__all__ = ["run_async_safely", "get_secret_from_env", "generate_function_summary"]
+__all__ = [
+    "BackgroundEventLoop",
+    "RESPONSE_ACCEPT",
+    "deadline",
+    "decode_response",
+    "run_async_safely",
+    "get_secret_from_env",
+    "json_dumps",
+    "json_loads",
+    "generate_function_summary",
+    "make_function_summary",
+]
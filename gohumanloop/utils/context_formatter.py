@@ -18,63 +18,51 @@ def _param_detail_en(p: inspect.Parameter) -> str:
     )
 
 
-def generate_function_summary(
-    fn: Callable,
-    *args: Any,
-    language: str = "zh",
-    **kwargs: Any,
-) -> str:
-    """生成支持中英文切换的函数说明模板
-
-    Args:
-        fn: 目标函数
-        *args: 位置参数示例
-        **kwargs: 关键字参数示例
-        language: 输出语言 ('zh'/'en')
-
-    Returns:
-        纯文本格式的函数说明
-    """
-
-    # 定义翻译类型
-
-    # 语言配置
-    translations: Dict[
-        str, Dict[str, Union[str, Callable[[inspect.Parameter], str]]]
-    ] = {
-        "zh": {
-            "title": "函数说明",
-            "name": "函数名称",
-            "module": "所属模块",
-            "description": "功能描述",
-            "params": "参数列表",
-            "param_detail": _param_detail_zh,
-            "return": "返回值类型",
-            "current_input": "当前输入",
-            "positional_args": "位置参数",
-            "keyword_args": "关键字参数",
-            "usage": "调用方式",
-            "approval": "审批状态",
-            "no_doc": "无文档说明",
-        },
-        "en": {
-            "title": "Function Documentation",
-            "name": "Function Name",
-            "module": "Module",
-            "description": "Description",
-            "params": "Parameters",
-            "param_detail": _param_detail_en,
-            "return": "Return Type",
-            "current_input": "Current Input",
-            "positional_args": "Positional Args",
-            "keyword_args": "Keyword Args",
-            "usage": "Usage",
-            "approval": "Approval Status",
-            "no_doc": "No documentation",
-        },
-    }
-
-    lang = translations.get(language, translations["zh"])
+# 语言配置
+_TRANSLATIONS: Dict[str, Dict[str, Union[str, Callable[[inspect.Parameter], str]]]] = {
+    "zh": {
+        "title": "函数说明",
+        "name": "函数名称",
+        "module": "所属模块",
+        "description": "功能描述",
+        "params": "参数列表",
+        "param_detail": _param_detail_zh,
+        "return": "返回值类型",
+        "current_input": "当前输入",
+        "positional_args": "位置参数",
+        "keyword_args": "关键字参数",
+        "usage": "调用方式",
+        "approval": "审批状态",
+        "no_doc": "无文档说明",
+    },
+    "en": {
+        "title": "Function Documentation",
+        "name": "Function Name",
+        "module": "Module",
+        "description": "Description",
+        "params": "Parameters",
+        "param_detail": _param_detail_en,
+        "return": "Return Type",
+        "current_input": "Current Input",
+        "positional_args": "Positional Args",
+        "keyword_args": "Keyword Args",
+        "usage": "Usage",
+        "approval": "Approval Status",
+        "no_doc": "No documentation",
+    },
+}
+
+
+def _get_translation(
+    language: str,
+) -> Dict[str, Union[str, Callable[[inspect.Parameter], str]]]:
+    """获取指定语言的翻译配置，未知语言回退为中文"""
+    return _TRANSLATIONS.get(language, _TRANSLATIONS["zh"])
+
+
+def _function_summary_header(fn: Callable, language: str) -> str:
+    """生成函数说明中与调用参数无关的静态部分"""
+    lang = _get_translation(language)
 
     # 明确告诉类型检查器这是一个可调用对象
     param_detail_func = cast(Callable[[inspect.Parameter], str], lang["param_detail"])
@@ -86,10 +74,8 @@ def generate_function_summary(
     doc = (fn.__doc__ or str(lang["no_doc"])).strip()
     sig = inspect.signature(fn)
 
-    # 构建模板
-    template = (
-        f"""
-- {lang['title']}: {func_name}
+    return (
+        f"""- {lang['title']}: {func_name}
 - {lang['name']}: {func_name}
 - {lang['module']}: {module}
 
@@ -104,14 +90,62 @@ def generate_function_summary(
 - {lang['return']}: {sig.return_annotation if sig.return_annotation != sig.empty else lang['no_doc']}
 
 - {lang['current_input']}:
-{lang['positional_args']}: {args}
-{lang['keyword_args']}: {kwargs}
-
-- {lang['usage']}: {func_name}(*{args}, **{kwargs})
-
 """
     )
-    return template.strip()
+
+
+def make_function_summary(
+    fn: Callable,
+    language: str = "zh",
+) -> Callable[..., str]:
+    """预先生成函数说明的静态部分，返回仅需填充调用参数的格式化函数
+
+    适用于装饰器场景：函数名、文档、签名在装饰时即已确定，
+    每次调用只需格式化位置参数和关键字参数。
+
+    Args:
+        fn: 目标函数
+        language: 输出语言 ('zh'/'en')
+
+    Returns:
+        接收 (*args, **kwargs) 并返回与 generate_function_summary 相同文本的函数
+    """
+    lang = _get_translation(language)
+    header = _function_summary_header(fn, language)
+    func_name = fn.__name__
+    positional_args = lang["positional_args"]
+    keyword_args = lang["keyword_args"]
+    usage = lang["usage"]
+
+    def summary(*args: Any, **kwargs: Any) -> str:
+        return (
+            f"""{header}{positional_args}: {args}
+{keyword_args}: {kwargs}
+
+- {usage}: {func_name}(*{args}, **{kwargs})"""
+        ).strip()
+
+    return summary
+
+
+def generate_function_summary(
+    fn: Callable,
+    *args: Any,
+    language: str = "zh",
+    **kwargs: Any,
+) -> str:
+    """生成支持中英文切换的函数说明模板
+
+    Args:
+        fn: 目标函数
+        *args: 位置参数示例
+        **kwargs: 关键字参数示例
+        language: 输出语言 ('zh'/'en')
+
+    Returns:
+        纯文本格式的函数说明
+    """
+    return make_function_summary(fn, language)(*args, **kwargs)
 
 
 if __name__ == "__main__":
@@ -1,11 +1,96 @@
 import asyncio
+import json
 import os
-from typing import Awaitable, Any, Optional, Union
+import sys
+import threading
+from typing import (
+    AsyncContextManager,
+    Awaitable,
+    Any,
+    Coroutine,
+    Optional,
+    TypeVar,
+    Union,
+)
 from pydantic import SecretStr
 import logging
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+try:
+    from msgspec import json as _msgspec_json  # type: ignore[import-not-found, unused-ignore]
+    from msgspec import msgpack as _msgspec_msgpack  # type: ignore[import-not-found, unused-ignore]
+except ImportError:
+    _msgspec_json = None  # type: ignore[assignment, unused-ignore]
+    _msgspec_msgpack = None  # type: ignore[assignment, unused-ignore]
+
+if _msgspec_json is not None:
+    _json_encoder = _msgspec_json.Encoder()
+    _json_decoder = _msgspec_json.Decoder()
+
+    def json_dumps(obj: Any) -> str:
+        """
+        Serialize obj to a JSON string using msgspec's C encoder
+        """
+        encoded: bytes = _json_encoder.encode(obj)
+        return encoded.decode("utf-8")
+
+    def json_loads(payload: Union[str, bytes]) -> Any:
+        """
+        Deserialize a JSON payload using msgspec's C decoder
+        """
+        return _json_decoder.decode(payload)
+
+else:
+
+    def json_dumps(obj: Any) -> str:
+        """
+        Serialize obj to a JSON string (install msgspec for a faster encoder)
+        """
+        return json.dumps(obj)
+
+    def json_loads(payload: Union[str, bytes]) -> Any:
+        """
+        Deserialize a JSON payload (install msgspec for a faster decoder)
+        """
+        return json.loads(payload)
+
+
+_msgpack_decoder = _msgspec_msgpack.Decoder() if _msgspec_msgpack is not None else None
+
+# Accept header for HTTP responses: MessagePack is only offered when it can be decoded
+RESPONSE_ACCEPT = (
+    "application/msgpack, application/json"
+    if _msgpack_decoder is not None
+    else "application/json"
+)
+
+
+def decode_response(payload: bytes, content_type: str) -> Any:
+    """
+    Deserialize an HTTP response body as MessagePack if the server sent it, else JSON
+    """
+    if content_type == "application/msgpack" and _msgpack_decoder is not None:
+        return _msgpack_decoder.decode(payload)
+    return json_loads(payload)
+
+
+if sys.version_info >= (3, 11):
+    from asyncio import timeout as _timeout
+else:
+    from async_timeout import timeout as _timeout
+
+
+def deadline(seconds: Optional[float]) -> AsyncContextManager[Any]:
+    """
+    Async context manager that cancels the enclosed block after `seconds`
+    and raises asyncio.TimeoutError. None or 0 means no limit.
+    Unlike asyncio.wait_for, it does not wrap the awaited coroutine in a new Task.
+    """
+    return _timeout(seconds or None)
+
 
 def run_async_safely(coro: Awaitable[Any]) -> Any:
     """
@@ -45,6 +130,69 @@ def run_async_safely(coro: Awaitable[Any]) -> Any:
             asyncio.set_event_loop(None)
 
 
+class BackgroundEventLoop:
+    """
+    Event loop running forever in a daemon thread.
+    Lets synchronous callers submit coroutines without creating a loop per call.
+    """
+
+    def __init__(self, name: str = "ghl-loop") -> None:
+        self._name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        loop = self._loop
+        if loop is not None:
+            return loop
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=_run_loop_forever, args=(loop,), name=self._name, daemon=True
+                )
+                thread.start()
+                self._loop, self._thread = loop, thread
+                logger.debug("Started background event loop %s.", self._name)
+            return self._loop
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run coroutine on the background loop and block until it completes"""
+        loop = self._ensure_loop()
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            coro.close()
+            raise RuntimeError(
+                "Cannot block on the background event loop from its own thread."
+            )
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    def close(self) -> None:
+        """Stop the background loop and wait for its thread to exit"""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        # The loop thread closes the loop itself, so close() may also be
+        # called from that thread (e.g. by a finalizer)
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+
+def _run_loop_forever(loop: asyncio.AbstractEventLoop) -> None:
+    """Thread target of BackgroundEventLoop: run the loop until stopped, then close it"""
+    try:
+        loop.run_forever()
+    finally:
+        loop.close()
+
+
 def get_secret_from_env(
     key: Union[str, list, tuple],
     default: Optional[str] = None,
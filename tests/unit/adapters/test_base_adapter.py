@@ -1,13 +1,24 @@
+import asyncio
+import gc
+import threading
 import unittest
-from unittest.mock import MagicMock
+import uuid
+import weakref
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import MagicMock, AsyncMock
 
 from gohumanloop.adapters.base_adapter import (
     HumanloopAdapter,
     HumanLoopWrapper,
+    get_active_state,
 )
 from gohumanloop.core.interface import (
     HumanLoopManager,
+    HumanLoopResult,
+    HumanLoopStatus,
+    HumanLoopType,
 )
+from gohumanloop.core.manager import DefaultHumanLoopManager
 
 
 class TestLangGraphAdapter(unittest.TestCase):
@@ -52,6 +63,235 @@ class TestLangGraphAdapter(unittest.TestCase):
         called_fn = wrapper(target_function)
         self.assertEqual(called_fn(), "测试成功")
 
+    def test_require_approval_ret_key_injection(self):
+        """测试仅在函数可接收 ret_key 时注入审批结果"""
+        self.mock_manager.async_request_humanloop = AsyncMock(
+            return_value=HumanLoopResult(
+                conversation_id="test-conv",
+                request_id="test-req",
+                loop_type=HumanLoopType.APPROVAL,
+                status=HumanLoopStatus.APPROVED,
+            )
+        )
+
+        @self.adapter.require_approval()
+        def without_ret_key(x):
+            return x
+
+        @self.adapter.require_approval()
+        def with_ret_key(x, approval_result=None):
+            return approval_result
+
+        @self.adapter.require_approval()
+        def with_var_kwargs(x, **kwargs):
+            return kwargs
+
+        self.assertEqual(without_ret_key(1), 1)
+
+        approval_info = with_ret_key(1)
+        self.assertEqual(approval_info["request_id"], "test-req")
+        self.assertEqual(approval_info["status"], HumanLoopStatus.APPROVED)
+
+        self.assertIn("approval_result", with_var_kwargs(1))
+
+    def test_conversation_turn_context_shape(self):
+        """测试多轮对话首轮 message 为函数信息，后续轮次为摘要并附带函数信息"""
+        self.mock_manager.async_upsert_humanloop = AsyncMock(
+            return_value=HumanLoopResult(
+                conversation_id="test-conv",
+                request_id="test-req",
+                loop_type=HumanLoopType.CONVERSATION,
+                status=HumanLoopStatus.COMPLETED,
+            )
+        )
+
+        @self.adapter.require_conversation(conversation_id="test-conv")
+        def node(x, conv_result=None):
+            return x
+
+        node(1)
+
+        # 由管理器一次调用决定继续还是新建对话，适配器不再单独查询
+        self.mock_manager.async_check_conversation_exist.assert_not_called()
+        kwargs = self.mock_manager.async_upsert_humanloop.call_args.kwargs
+        self.assertEqual(kwargs["initial_context"]["message"]["function_name"], "node")
+        self.assertNotIn("function", kwargs["initial_context"])
+        self.assertIsInstance(kwargs["context"]["message"], str)
+        self.assertEqual(kwargs["context"]["function"]["function_name"], "node")
+
+    def test_sync_function_runs_in_caller_thread(self):
+        """测试同步函数在调用线程中执行，仅人机交互经过后台事件循环"""
+        self.mock_manager.supports_sync = True
+        self.mock_manager.async_request_humanloop = AsyncMock(
+            return_value=HumanLoopResult(
+                conversation_id="test-conv",
+                request_id="test-req",
+                loop_type=HumanLoopType.INFORMATION,
+                status=HumanLoopStatus.COMPLETED,
+            )
+        )
+
+        @self.adapter.require_info()
+        def node(x, info_result=None):
+            return threading.current_thread(), info_result["request_id"]
+
+        with self.adapter:
+            thread, request_id = node(1)
+
+        self.assertIs(thread, threading.current_thread())
+        self.assertEqual(request_id, "test-req")
+
+    def test_temporary_adapter_stops_background_loop(self):
+        """测试临时适配器被回收后其后台事件循环线程随之退出"""
+        self.mock_manager.supports_sync = True
+        self.mock_manager.async_request_humanloop = AsyncMock(
+            return_value=HumanLoopResult(
+                conversation_id="test-conv",
+                request_id="test-req",
+                loop_type=HumanLoopType.INFORMATION,
+                status=HumanLoopStatus.COMPLETED,
+            )
+        )
+
+        def node(x, info_result=None):
+            return threading.current_thread()
+
+        wrapped = HumanloopAdapter(self.mock_manager).require_info()(node)
+        wrapped(1)
+        bg_threads = [t for t in threading.enumerate() if t.name == "ghl-adapter-loop"]
+        self.assertEqual(len(bg_threads), 1)
+
+        del wrapped
+        gc.collect()
+        bg_threads[0].join(timeout=5)
+        self.assertFalse(bg_threads[0].is_alive())
+
+    def test_callback_class_used_as_factory(self):
+        """测试传入回调类时按工厂处理，每次调用以 state 实例化"""
+
+        class StateCallback:
+            def __init__(self, state):
+                self.state = state
+
+            async def async_on_humanloop_request(self, provider, request):
+                pass
+
+            async def async_on_humanloop_update(self, provider, result):
+                pass
+
+            async def async_on_humanloop_timeout(self, provider, result):
+                pass
+
+            async def async_on_humanloop_error(self, provider, error):
+                pass
+
+        self.mock_manager.async_request_humanloop = AsyncMock(
+            return_value=HumanLoopResult(
+                conversation_id="test-conv",
+                request_id="test-req",
+                loop_type=HumanLoopType.APPROVAL,
+                status=HumanLoopStatus.APPROVED,
+            )
+        )
+
+        @self.adapter.require_approval(callback=StateCallback)
+        def node(state):
+            return state
+
+        node({"step": 1})
+
+        callback = self.mock_manager.async_request_humanloop.call_args.kwargs[
+            "callback"
+        ]
+        self.assertIsInstance(callback, StateCallback)
+        self.assertEqual(callback.state, {"step": 1})
+
+    def test_active_state_during_humanloop(self):
+        """测试人机交互期间可通过 get_active_state 读取当前调用的 state"""
+        seen_states = []
+
+        async def request_humanloop(**kwargs):
+            seen_states.append(get_active_state())
+            return HumanLoopResult(
+                conversation_id="test-conv",
+                request_id="test-req",
+                loop_type=HumanLoopType.APPROVAL,
+                status=HumanLoopStatus.APPROVED,
+            )
+
+        self.mock_manager.async_request_humanloop = AsyncMock(
+            side_effect=request_humanloop
+        )
+
+        @self.adapter.require_approval()
+        def node(state):
+            return state
+
+        node({"step": 1})
+        node({"step": 2})
+
+        self.assertEqual(seen_states, [{"step": 1}, {"step": 2}])
+        self.assertIsNone(get_active_state())
+
+    def test_decorated_function_has_no_reference_cycle(self):
+        """测试装饰器闭包不产生循环引用，释放后适配器可被引用计数直接回收"""
+        adapter = HumanloopAdapter(self.mock_manager)
+        adapter_ref = weakref.ref(adapter)
+
+        def node(x):
+            return x
+
+        wrapped = adapter.require_approval()(node)
+        del adapter
+        # 装饰后的函数需要强引用适配器，临时创建的适配器才能继续使用
+        self.assertIsNotNone(adapter_ref())
+
+        gc.disable()
+        try:
+            del wrapped
+            self.assertIsNone(adapter_ref())
+        finally:
+            gc.enable()
+
+
+class TestAdapterWithDefaultManager(IsolatedAsyncioTestCase):
+    """测试适配器与 DefaultHumanLoopManager 配合使用"""
+
+    async def test_mixed_sync_and_async_calls(self):
+        """测试同一适配器上同步与异步装饰函数并发调用，同步调用不使用后台事件循环线程"""
+
+        async def request_humanloop(task_id, conversation_id, loop_type, **kwargs):
+            await asyncio.sleep(0.01)
+            return HumanLoopResult(
+                conversation_id=conversation_id,
+                request_id=str(uuid.uuid4()),
+                loop_type=loop_type,
+                status=HumanLoopStatus.COMPLETED,
+            )
+
+        provider = MagicMock()
+        provider.name = "mock_provider"
+        provider.async_request_humanloop = AsyncMock(side_effect=request_humanloop)
+        manager = DefaultHumanLoopManager(provider)
+        adapter = HumanloopAdapter(manager)
+
+        @adapter.require_info()
+        def sync_node(x, info_result=None):
+            return info_result["request_id"]
+
+        @adapter.require_info()
+        async def async_node(x, info_result=None):
+            return info_result["request_id"]
+
+        request_ids = await asyncio.gather(
+            *(asyncio.to_thread(sync_node, i) for i in range(3)),
+            *(async_node(i) for i in range(3)),
+        )
+
+        self.assertEqual(len(set(request_ids)), 6)
+        self.assertEqual(len(manager._request_task), 6)
+        self.assertNotIn("ghl-adapter-loop", [t.name for t in threading.enumerate()])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,3 +1,4 @@
+import json
 import unittest
 import pytest
 from unittest.mock import MagicMock, AsyncMock
@@ -28,6 +29,12 @@ class TestHumanLoopStatus(unittest.TestCase):
         self.assertEqual(HumanLoopStatus.INPROGRESS.value, "inprogress")
         self.assertEqual(HumanLoopStatus.CANCELLED.value, "cancelled")
 
+    def test_status_is_str(self):
+        """测试状态可直接按字符串比较和序列化"""
+        self.assertEqual(HumanLoopStatus.APPROVED, "approved")
+        self.assertEqual(HumanLoopStatus("approved"), HumanLoopStatus.APPROVED)
+        self.assertEqual(json.dumps(HumanLoopStatus.APPROVED), '"approved"')
+
 
 class TestHumanLoopType(unittest.TestCase):
     """测试 HumanLoopType 枚举"""
@@ -80,6 +87,24 @@ class TestHumanLoopRequest(unittest.TestCase):
         self.assertIsNone(request.timeout)
         self.assertIsNone(request.created_at)
 
+    def test_request_and_result_use_slots(self):
+        """测试请求和结果对象不带 __dict__"""
+        request = HumanLoopRequest(
+            task_id="test-task",
+            conversation_id="test-conversation",
+            loop_type=HumanLoopType.APPROVAL,
+            context={},
+        )
+        result = HumanLoopResult(
+            conversation_id="test-conversation",
+            request_id="test-request",
+            loop_type=HumanLoopType.APPROVAL,
+            status=HumanLoopStatus.PENDING,
+        )
+
+        self.assertFalse(hasattr(request, "__dict__"))
+        self.assertFalse(hasattr(result, "__dict__"))
+
 
 class TestHumanLoopResult(unittest.TestCase):
     """测试 HumanLoopResult 数据类"""
@@ -142,6 +167,35 @@ class TestHumanLoopResult(unittest.TestCase):
         self.assertEqual(result.status, HumanLoopStatus.ERROR)
         self.assertEqual(result.error, "Something went wrong")
 
+    def test_result_as_dict(self):
+        """测试结果转换为字典"""
+        response = {"answer": "yes"}
+        result = HumanLoopResult(
+            conversation_id="test-conversation",
+            request_id="test-request",
+            loop_type=HumanLoopType.APPROVAL,
+            status=HumanLoopStatus.APPROVED,
+            response=response,
+        )
+
+        data = result.as_dict()
+        self.assertEqual(
+            data,
+            {
+                "conversation_id": "test-conversation",
+                "request_id": "test-request",
+                "loop_type": HumanLoopType.APPROVAL,
+                "status": HumanLoopStatus.APPROVED,
+                "response": response,
+                "feedback": {},
+                "responded_by": None,
+                "responded_at": None,
+                "error": None,
+            },
+        )
+        # 浅拷贝：字段值不被复制
+        self.assertIs(data["response"], response)
+
 
 # 创建一个模拟的回调实现
 class MockCallbackImplementation(HumanLoopCallback):
@@ -186,7 +240,27 @@ class MockCallbackImplementation(HumanLoopCallback):
 
 
 class TestHumanLoopCallback(IsolatedAsyncioTestCase):
-    """测试 HumanLoopCallback 抽象类"""
+    """测试 HumanLoopCallback 协议"""
+
+    def test_structural_conformance(self):
+        """测试未继承协议但实现了全部方法的对象也被识别为回调"""
+
+        class DuckCallback:
+            async def async_on_humanloop_request(self, provider, request):
+                pass
+
+            async def async_on_humanloop_update(self, provider, result):
+                pass
+
+            async def async_on_humanloop_timeout(self, provider, result):
+                pass
+
+            async def async_on_humanloop_error(self, provider, error):
+                pass
+
+        self.assertIsInstance(DuckCallback(), HumanLoopCallback)
+        self.assertIsInstance(MockCallbackImplementation(), HumanLoopCallback)
+        self.assertNotIsInstance(object(), HumanLoopCallback)
 
     @pytest.mark.asyncio(loop_scope="module")
     async def test_callback_methods(self):
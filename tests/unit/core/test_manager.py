@@ -1,5 +1,7 @@
+import asyncio
+import threading
 import unittest
-from unittest.mock import MagicMock, AsyncMock
+from unittest.mock import MagicMock, AsyncMock, patch
 from unittest.async_case import IsolatedAsyncioTestCase
 
 from gohumanloop.core.interface import (
@@ -8,6 +10,7 @@ from gohumanloop.core.interface import (
     HumanLoopResult,
 )
 from gohumanloop.core.manager import DefaultHumanLoopManager
+from gohumanloop.providers.base import BaseProvider
 
 
 class MockHumanLoopProvider:
@@ -29,6 +32,53 @@ class MockHumanLoopProvider:
         self.continue_humanloop = MagicMock()
 
 
+class NotifyingProvider(BaseProvider):
+    """基于 BaseProvider 的内存提供者，用于测试状态变更通知"""
+
+    async def async_request_humanloop(
+        self,
+        task_id,
+        conversation_id,
+        loop_type,
+        context,
+        metadata=None,
+        timeout=None,
+    ):
+        request_id = self._generate_request_id()
+        self._store_request(
+            conversation_id=conversation_id,
+            request_id=request_id,
+            task_id=task_id,
+            loop_type=loop_type,
+            context=context,
+            metadata=metadata or {},
+            timeout=timeout,
+        )
+        return HumanLoopResult(
+            conversation_id=conversation_id,
+            request_id=request_id,
+            loop_type=loop_type,
+            status=HumanLoopStatus.PENDING,
+        )
+
+    async def async_check_request_status(self, conversation_id, request_id):
+        request_info = self._get_request(conversation_id, request_id)
+        return HumanLoopResult(
+            conversation_id=conversation_id,
+            request_id=request_id,
+            loop_type=request_info["loop_type"],
+            status=request_info["status"],
+            response=request_info.get("response", {}),
+        )
+
+    def respond(self, conversation_id, request_id, response):
+        """模拟人工在其他线程中完成响应"""
+        request_info = self._get_request(conversation_id, request_id)
+        request_info["status"] = HumanLoopStatus.COMPLETED
+        request_info["response"] = response
+        self._notify_status_change(conversation_id, request_id)
+
+
 class MockHumanLoopCallback:
     """模拟人机循环回调"""
 
@@ -69,6 +119,19 @@ class TestDefaultHumanLoopManager(IsolatedAsyncioTestCase):
         provider_id3 = self.manager.register_provider(provider3, None)
         self.assertTrue(provider_id3.startswith("provider_"))
 
+    async def test_register_provider_generated_ids_unique(self):
+        """测试自动生成的提供者ID不与已注册的ID冲突"""
+        explicit = MockHumanLoopProvider(name="explicit")
+        await self.manager.async_register_provider(explicit, "provider_1")
+
+        generated_ids = [
+            await self.manager.async_register_provider(MockHumanLoopProvider())
+            for _ in range(2)
+        ]
+
+        self.assertEqual(generated_ids, ["provider_2", "provider_3"])
+        self.assertIs(self.manager.providers["provider_1"], explicit)
+
     async def test_request_humanloop(self):
         """测试请求人机循环"""
         # 注册提供者
@@ -153,6 +216,51 @@ class TestDefaultHumanLoopManager(IsolatedAsyncioTestCase):
 
         # 验证内部状态更新
         self.assertIn("test-req-2", self.manager._conversation_requests["test-conv"])
+        self.assertEqual(
+            self.manager._request_task[("test-conv", "test-req-2")], "test-task"
+        )
+
+    async def test_upsert_humanloop(self):
+        """测试首次调用创建对话，之后继续对话"""
+        await self.manager.async_register_provider(self.provider, "test_provider")
+        self.manager.default_provider_id = "test_provider"
+
+        self.provider.async_request_humanloop.return_value = HumanLoopResult(
+            conversation_id="test-conv",
+            request_id="test-req-1",
+            loop_type=HumanLoopType.CONVERSATION,
+            status=HumanLoopStatus.PENDING,
+        )
+        self.provider.async_continue_humanloop.return_value = HumanLoopResult(
+            conversation_id="test-conv",
+            request_id="test-req-2",
+            loop_type=HumanLoopType.CONVERSATION,
+            status=HumanLoopStatus.PENDING,
+        )
+
+        for _ in range(2):
+            await self.manager.async_upsert_humanloop(
+                task_id="test-task",
+                conversation_id="test-conv",
+                loop_type=HumanLoopType.CONVERSATION,
+                context={"message": "Hello"},
+                initial_context={"message": "First"},
+            )
+
+        self.provider.async_request_humanloop.assert_called_once()
+        self.provider.async_continue_humanloop.assert_called_once()
+        self.assertEqual(
+            self.provider.async_request_humanloop.call_args.kwargs["context"],
+            {"message": "First"},
+        )
+        self.assertEqual(
+            self.provider.async_continue_humanloop.call_args.kwargs["context"],
+            {"message": "Hello"},
+        )
+        self.assertEqual(
+            await self.manager.async_get_conversation_requests("test-conv"),
+            ["test-req-1", "test-req-2"],
+        )
 
     async def test_check_request_status(self):
         """测试检查请求状态"""
@@ -223,6 +331,37 @@ class TestDefaultHumanLoopManager(IsolatedAsyncioTestCase):
         # 验证内部状态更新
         self.assertNotIn("test-req", self.manager._conversation_requests["test-conv"])
 
+    async def test_cancel_conversation(self):
+        """测试取消对话时只清理该对话的状态"""
+        await self.manager.async_register_provider(self.provider, "test_provider")
+        self.manager.default_provider_id = "test_provider"
+
+        for conversation_id in ("conv-a", "conv-b"):
+            self.provider.async_request_humanloop.return_value = HumanLoopResult(
+                conversation_id=conversation_id,
+                request_id=f"req-{conversation_id}",
+                loop_type=HumanLoopType.APPROVAL,
+                status=HumanLoopStatus.PENDING,
+            )
+            await self.manager.async_request_humanloop(
+                task_id="test-task",
+                conversation_id=conversation_id,
+                loop_type=HumanLoopType.APPROVAL,
+                context={"message": "Please approve"},
+                callback=MockHumanLoopCallback(),
+            )
+        self.provider.async_cancel_conversation.return_value = True
+
+        result = await self.manager.async_cancel_conversation("conv-a")
+
+        self.assertTrue(result)
+        self.provider.async_cancel_conversation.assert_called_once_with("conv-a")
+        self.assertNotIn("conv-a", self.manager._conversation_requests)
+        self.assertEqual(list(self.manager._callbacks), [("conv-b", "req-conv-b")])
+        self.assertEqual(list(self.manager._request_task), [("conv-b", "req-conv-b")])
+        self.assertEqual(self.manager._task_conversations["test-task"], {"conv-b"})
+        self.assertEqual(self.manager._conversation_task, {"conv-b": "test-task"})
+
     async def test_callback_mechanism(self):
         """测试回调机制"""
         # 注册提供者
@@ -272,6 +411,110 @@ class TestDefaultHumanLoopManager(IsolatedAsyncioTestCase):
         self.assertEqual(args[0], self.provider)
         self.assertEqual(args[1].status, HumanLoopStatus.APPROVED)
 
+    async def test_blocking_request_returns_immediate_result(self):
+        """测试提供者直接返回最终结果时，阻塞请求不再查询状态"""
+        await self.manager.async_register_provider(self.provider, "test_provider")
+        callback = MockHumanLoopCallback()
+
+        mock_result = HumanLoopResult(
+            conversation_id="test-conv",
+            request_id="test-req",
+            loop_type=HumanLoopType.APPROVAL,
+            status=HumanLoopStatus.APPROVED,
+        )
+        self.provider.async_request_humanloop.return_value = mock_result
+
+        result = await self.manager.async_request_humanloop(
+            task_id="test-task",
+            conversation_id="test-conv",
+            loop_type=HumanLoopType.APPROVAL,
+            context={"message": "Please approve"},
+            callback=callback,
+            blocking=True,
+        )
+
+        self.assertIs(result, mock_result)
+        self.provider.async_check_request_status.assert_not_called()
+        callback.async_on_humanloop_update.assert_called_once_with(
+            self.provider, mock_result
+        )
+
+    async def test_polling_interval_backs_off(self):
+        """测试提供者不支持通知时，轮询间隔按指数退避增长"""
+        await self.manager.async_register_provider(self.provider, "mock_provider")
+
+        pending = HumanLoopResult(
+            conversation_id="test-conv",
+            request_id="test-req",
+            loop_type=HumanLoopType.APPROVAL,
+            status=HumanLoopStatus.PENDING,
+        )
+        approved = HumanLoopResult(
+            conversation_id="test-conv",
+            request_id="test-req",
+            loop_type=HumanLoopType.APPROVAL,
+            status=HumanLoopStatus.APPROVED,
+        )
+        self.provider.async_request_humanloop.return_value = pending
+        self.provider.async_check_request_status.side_effect = [
+            pending,
+            pending,
+            pending,
+            approved,
+        ]
+
+        with patch("gohumanloop.core.manager.asyncio.sleep", new=AsyncMock()) as sleep:
+            result = await self.manager.async_request_humanloop(
+                task_id="test-task",
+                conversation_id="test-conv",
+                loop_type=HumanLoopType.APPROVAL,
+                context={"message": "Please approve"},
+                blocking=True,
+            )
+
+        self.assertEqual(result.status, HumanLoopStatus.APPROVED)
+        intervals = [call.args[0] for call in sleep.await_args_list]
+        self.assertEqual(len(intervals), 3)
+        self.assertAlmostEqual(intervals[0], 0.1)
+        self.assertAlmostEqual(intervals[1], 0.15)
+        self.assertAlmostEqual(intervals[2], 0.225)
+
+    async def test_terminal_status_releases_callback(self):
+        """测试请求进入最终状态后回调被释放，即使回调执行出错"""
+        await self.manager.async_register_provider(self.provider, "test_provider")
+        callback = MockHumanLoopCallback()
+        callback.async_on_humanloop_update.side_effect = RuntimeError("boom")
+
+        self.provider.async_request_humanloop.return_value = HumanLoopResult(
+            conversation_id="test-conv",
+            request_id="test-req",
+            loop_type=HumanLoopType.APPROVAL,
+            status=HumanLoopStatus.PENDING,
+        )
+        await self.manager.async_request_humanloop(
+            task_id="test-task",
+            conversation_id="test-conv",
+            loop_type=HumanLoopType.APPROVAL,
+            context={"message": "Please approve"},
+            callback=callback,
+        )
+        self.assertIn(("test-conv", "test-req"), self.manager._callbacks)
+
+        self.provider.async_check_request_status.return_value = HumanLoopResult(
+            conversation_id="test-conv",
+            request_id="test-req",
+            loop_type=HumanLoopType.APPROVAL,
+            status=HumanLoopStatus.APPROVED,
+        )
+        await self.manager.async_check_request_status("test-conv", "test-req")
+
+        callback.async_on_humanloop_error.assert_called_once()
+        self.assertNotIn(("test-conv", "test-req"), self.manager._callbacks)
+        self.assertEqual(
+            await self.manager.async_get_request_task("test-conv", "test-req"),
+            "test-task",
+        )
+
     async def test_error_handling(self):
         """测试错误处理"""
         # 注册提供者
@@ -300,6 +543,122 @@ class TestDefaultHumanLoopManager(IsolatedAsyncioTestCase):
         self.assertEqual(args[0], self.provider)
         self.assertIsInstance(args[1], ValueError)
 
+    async def test_failing_error_callback_is_logged(self):
+        """测试错误回调自身失败时记录日志，原异常仍抛出"""
+        await self.manager.async_register_provider(self.provider, "test_provider")
+        callback = MockHumanLoopCallback()
+        callback.async_on_humanloop_error.side_effect = RuntimeError("callback")
+        self.provider.async_request_humanloop.side_effect = ValueError("Test error")
+
+        with self.assertLogs("gohumanloop.core.manager", level="ERROR") as logs:
+            with self.assertRaises(ValueError):
+                await self.manager.async_request_humanloop(
+                    task_id="test-task",
+                    conversation_id="test-conv",
+                    loop_type=HumanLoopType.APPROVAL,
+                    context={"message": "Please approve"},
+                    callback=callback,
+                )
+
+        self.assertIn("Test error", logs.output[0])
+
+
+class TestWaitForStatusChange(IsolatedAsyncioTestCase):
+    """测试基于通知的状态等待"""
+
+    async def test_wait_for_conversation_status_change(self):
+        """测试状态变更通知唤醒等待者"""
+        provider = NotifyingProvider(name="notifying")
+        manager = DefaultHumanLoopManager(initial_providers=provider)
+
+        request_id = await manager.async_request_humanloop(
+            task_id="test-task",
+            conversation_id="test-conv",
+            loop_type=HumanLoopType.INFORMATION,
+            context={"message": "Please input"},
+        )
+
+        timer = threading.Timer(
+            0.05, provider.respond, ("test-conv", request_id, {"answer": 42})
+        )
+        timer.start()
+        try:
+            result = await manager.async_wait_for_conversation_status_change(
+                "test-conv", timeout=0.9
+            )
+        finally:
+            timer.cancel()
+
+        self.assertEqual(result.status, HumanLoopStatus.COMPLETED)
+        self.assertEqual(result.response, {"answer": 42})
+        self.assertEqual(provider._status_waiters, {})
+
+    async def test_blocking_request_woken_by_notification(self):
+        """测试阻塞请求由状态变更通知唤醒，无需等待轮询间隔"""
+        provider = NotifyingProvider(name="notifying")
+        manager = DefaultHumanLoopManager(initial_providers=provider)
+        provider._generate_request_id = lambda: "req-1"
+
+        timer = threading.Timer(
+            0.05, provider.respond, ("test-conv", "req-1", {"answer": 42})
+        )
+        timer.start()
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        try:
+            result = await manager.async_request_humanloop(
+                task_id="test-task",
+                conversation_id="test-conv",
+                loop_type=HumanLoopType.INFORMATION,
+                context={"message": "Please input"},
+                blocking=True,
+            )
+        finally:
+            timer.cancel()
+
+        self.assertEqual(result.status, HumanLoopStatus.COMPLETED)
+        self.assertLess(loop.time() - started, 0.9)
+
+    async def test_blocking_request_polls_provider_without_notification(self):
+        """测试提供者改变状态但不发出通知时，阻塞请求仍通过轮询拿到结果"""
+
+        class PullProvider(NotifyingProvider):
+            """状态直接从远端拉取，不写回本地存储也不发出通知"""
+
+            checks = 0
+
+            async def async_check_request_status(self, conversation_id, request_id):
+                PullProvider.checks += 1
+                status = (
+                    HumanLoopStatus.COMPLETED
+                    if PullProvider.checks >= 3
+                    else HumanLoopStatus.PENDING
+                )
+                return HumanLoopResult(
+                    conversation_id=conversation_id,
+                    request_id=request_id,
+                    loop_type=HumanLoopType.INFORMATION,
+                    status=status,
+                )
+
+        provider = PullProvider(name="pull")
+        manager = DefaultHumanLoopManager(initial_providers=provider)
+
+        result = await asyncio.wait_for(
+            manager.async_request_humanloop(
+                task_id="test-task",
+                conversation_id="test-conv",
+                loop_type=HumanLoopType.INFORMATION,
+                context={"message": "Please input"},
+                blocking=True,
+            ),
+            timeout=2,
+        )
+
+        self.assertEqual(result.status, HumanLoopStatus.COMPLETED)
+        self.assertEqual(PullProvider.checks, 3)
+        self.assertEqual(provider._status_waiters, {})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,140 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+from unittest.async_case import IsolatedAsyncioTestCase
+
+from gohumanloop.core.interface import (
+    HumanLoopStatus,
+    HumanLoopType,
+    HumanLoopResult,
+)
+from gohumanloop.manager.batching_manager import BatchingHumanLoopManager
+
+
+class MockHumanLoopProvider:
+    """模拟人机循环提供者"""
+
+    def __init__(self, name="mock_provider"):
+        self.name = name
+        self.async_request_humanloop = AsyncMock(side_effect=self._request)
+        self.request_humanloop = MagicMock()
+        self.async_check_request_status = AsyncMock()
+
+    async def _request(self, task_id, conversation_id, loop_type, **kwargs):
+        return HumanLoopResult(
+            conversation_id=conversation_id,
+            request_id=f"req-{conversation_id}",
+            loop_type=loop_type,
+            status=HumanLoopStatus.PENDING,
+        )
+
+
+class TestBatchingHumanLoopManager(IsolatedAsyncioTestCase):
+    """测试 BatchingHumanLoopManager 类"""
+
+    async def asyncSetUp(self):
+        """测试前准备"""
+        self.provider = MockHumanLoopProvider()
+        self.manager = BatchingHumanLoopManager(batch_window=0.01)
+        await self.manager.async_register_provider(self.provider, "mock_provider")
+
+    async def test_concurrent_requests_share_one_batch(self):
+        """测试并发请求合并为一次批量提交"""
+        self.manager.async_request_humanloop_many = AsyncMock(
+            wraps=self.manager.async_request_humanloop_many
+        )
+
+        results = await asyncio.gather(
+            *(
+                self.manager.async_request_humanloop(
+                    task_id="task",
+                    conversation_id=f"conv-{i}",
+                    loop_type=HumanLoopType.INFORMATION,
+                    context={"message": "hi"},
+                )
+                for i in range(3)
+            )
+        )
+
+        self.assertEqual(results, ["req-conv-0", "req-conv-1", "req-conv-2"])
+        self.manager.async_request_humanloop_many.assert_awaited_once()
+        self.assertEqual(self.provider.async_request_humanloop.await_count, 3)
+
+    async def test_failed_request_does_not_affect_batch(self):
+        """测试批次中单个请求失败不影响其他请求"""
+        results = await asyncio.gather(
+            self.manager.async_request_humanloop(
+                task_id="task",
+                conversation_id="conv-ok",
+                loop_type=HumanLoopType.INFORMATION,
+                context={},
+            ),
+            self.manager.async_request_humanloop(
+                task_id="task",
+                conversation_id="conv-bad",
+                loop_type=HumanLoopType.INFORMATION,
+                context={},
+                provider_id="missing",
+            ),
+            return_exceptions=True,
+        )
+
+        self.assertEqual(results[0], "req-conv-ok")
+        self.assertIsInstance(results[1], ValueError)
+
+    async def test_blocking_request_waits_for_result(self):
+        """测试阻塞模式在批量提交后等待结果"""
+        self.provider.async_check_request_status.return_value = HumanLoopResult(
+            conversation_id="conv",
+            request_id="req-conv",
+            loop_type=HumanLoopType.APPROVAL,
+            status=HumanLoopStatus.APPROVED,
+        )
+
+        result = await self.manager.async_request_humanloop(
+            task_id="task",
+            conversation_id="conv",
+            loop_type=HumanLoopType.APPROVAL,
+            context={},
+            blocking=True,
+        )
+
+        self.assertIsInstance(result, HumanLoopResult)
+        self.assertEqual(result.status, HumanLoopStatus.APPROVED)
+
+    async def test_provider_batch_called_once(self):
+        """测试同一提供者的请求通过一次批量接口提交"""
+
+        async def request_batch(requests):
+            return [
+                HumanLoopResult(
+                    conversation_id=request.conversation_id,
+                    request_id=f"batch-{request.conversation_id}",
+                    loop_type=request.loop_type,
+                    status=HumanLoopStatus.PENDING,
+                )
+                for request in requests
+            ]
+
+        self.provider.async_request_humanloop_batch = AsyncMock(
+            side_effect=request_batch
+        )
+
+        results = await asyncio.gather(
+            *(
+                self.manager.async_request_humanloop(
+                    task_id="task",
+                    conversation_id=f"conv-{i}",
+                    loop_type=HumanLoopType.APPROVAL,
+                    context={},
+                )
+                for i in range(3)
+            )
+        )
+
+        self.assertEqual(results, ["batch-conv-0", "batch-conv-1", "batch-conv-2"])
+        self.provider.async_request_humanloop_batch.assert_awaited_once()
+        self.provider.async_request_humanloop.assert_not_awaited()
+        self.assertEqual(
+            sorted(await self.manager.async_get_task_conversations("task")),
+            ["conv-0", "conv-1", "conv-2"],
+        )
@@ -1,7 +1,10 @@
+import asyncio
 import unittest
+from unittest import IsolatedAsyncioTestCase
 
 from pydantic import SecretStr
 
+from gohumanloop.core.interface import HumanLoopStatus, HumanLoopType
 from gohumanloop.providers.api_provider import APIProvider
 
 
@@ -65,3 +68,253 @@ class TestAPIProviderInit(unittest.TestCase):
         self.assertIn("conversations=0", str_repr)
         self.assertIn("total_requests=0", str_repr)
         self.assertIn("active_requests=0", str_repr)
+
+    def test_default_headers_cached_per_api_key(self):
+        """测试默认请求头被缓存，api_key 变化时重新生成"""
+        provider = APIProvider(
+            name="test_api_provider",
+            api_base_url="https://api.example.com",
+            api_key=SecretStr("key-1"),
+        )
+
+        headers = provider._get_default_headers()
+        self.assertEqual(headers["Authorization"], "Bearer key-1")
+        self.assertIs(provider._get_default_headers(), headers)
+
+        provider.api_key = SecretStr("key-2")
+        self.assertEqual(
+            provider._get_default_headers()["Authorization"], "Bearer key-2"
+        )
+
+    def test_endpoint_urls_cached(self):
+        """测试端点 URL 只解析一次，api_base_url 变化后重新构建"""
+        provider = APIProvider(
+            name="test_api_provider", api_base_url="https://api.example.com/"
+        )
+
+        url = provider._get_url("/v1/humanloop/status")
+        self.assertEqual(str(url), "https://api.example.com/v1/humanloop/status")
+        self.assertIs(provider._get_url("/v1/humanloop/status"), url)
+
+        provider.api_base_url = "https://other.example.com"
+        self.assertEqual(
+            str(provider._get_url("/v1/humanloop/status")),
+            "https://other.example.com/v1/humanloop/status",
+        )
+
+
+class TestAPIProviderSession(IsolatedAsyncioTestCase):
+    """测试 APIProvider 的 HTTP 会话复用"""
+
+    async def test_session_reused_within_loop(self):
+        """测试同一事件循环内复用同一个会话，关闭后重新创建"""
+        provider = APIProvider(
+            name="test_api_provider", api_base_url="https://api.example.com"
+        )
+
+        session = provider._get_session()
+        self.assertIs(provider._get_session(), session)
+
+        await provider.async_close()
+        self.assertTrue(session.closed)
+        new_session = provider._get_session()
+        self.assertIsNot(new_session, session)
+        await provider.async_close()
+
+    async def test_async_context_manager_closes_session(self):
+        """测试异步上下文管理器退出时关闭会话"""
+        async with APIProvider(
+            name="test_api_provider", api_base_url="https://api.example.com"
+        ) as provider:
+            session = provider._get_session()
+            self.assertFalse(session.closed)
+        self.assertTrue(session.closed)
+
+    async def test_close_sessions_of_other_loops(self):
+        """测试 async_close 在各自的事件循环上关闭所有会话"""
+        import threading
+
+        provider = APIProvider(
+            name="test_api_provider", api_base_url="https://api.example.com"
+        )
+        other_loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=other_loop.run_forever, daemon=True)
+        thread.start()
+        try:
+            asyncio.run_coroutine_threadsafe(
+                provider._async_open_loop_session(), other_loop
+            ).result(timeout=5)
+            session = provider._get_session()
+            other = next(s for s in provider._sessions.values() if s is not session)
+
+            await provider.async_close()
+            self.assertTrue(session.closed)
+            self.assertTrue(other.closed)
+            self.assertEqual(provider._sessions, {})
+        finally:
+            other_loop.call_soon_threadsafe(other_loop.stop)
+            thread.join()
+            other_loop.close()
+
+    async def test_unmanaged_loop_uses_per_request_session(self):
+        """测试未由提供者管理的事件循环上每次请求使用临时会话，不留下会话"""
+        from aiohttp import web
+        from aiohttp.test_utils import TestServer
+
+        async def status(request):
+            return web.json_response({"success": True})
+
+        app = web.Application()
+        app.router.add_get("/v1/humanloop/status", status)
+        async with TestServer(app) as server:
+            provider = APIProvider(
+                name="test_api_provider", api_base_url=str(server.make_url(""))
+            )
+            await provider._async_make_api_request("v1/humanloop/status", "GET")
+            self.assertEqual(provider._sessions, {})
+
+            async with provider:
+                session = provider._get_session()
+                await provider._async_make_api_request("v1/humanloop/status", "GET")
+                self.assertIs(provider._get_session(), session)
+                self.assertFalse(session.closed)
+            self.assertTrue(session.closed)
+            self.assertEqual(provider._sessions, {})
+
+    async def test_conditional_request_reuses_cached_body(self):
+        """测试带 cache_key 的请求发送 If-None-Match，304 时复用缓存的响应体"""
+        from aiohttp import web
+        from aiohttp.test_utils import TestServer
+
+        seen_etags = []
+
+        async def status(request):
+            seen_etags.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return web.Response(status=304)
+            return web.json_response(
+                {"success": True, "status": "pending"}, headers={"ETag": '"v1"'}
+            )
+
+        app = web.Application()
+        app.router.add_get("/v1/humanloop/status", status)
+        async with TestServer(app) as server:
+            provider = APIProvider(
+                name="test_api_provider", api_base_url=str(server.make_url(""))
+            )
+            try:
+                first = await provider._async_make_api_request(
+                    "v1/humanloop/status", method="GET", cache_key=("conv", "req")
+                )
+                second = await provider._async_make_api_request(
+                    "v1/humanloop/status", method="GET", cache_key=("conv", "req")
+                )
+            finally:
+                await provider.async_close()
+
+        self.assertEqual(seen_etags, [None, '"v1"'])
+        self.assertEqual(first, {"success": True, "status": "pending"})
+        self.assertIs(second, first)
+
+    async def test_error_message_read_from_body_head(self):
+        """测试错误响应只读取开头部分，并优先使用其中的 error 字段"""
+        from aiohttp import web
+        from aiohttp.test_utils import TestServer
+
+        async def bad_request(request):
+            return web.json_response({"error": "invalid platform"}, status=400)
+
+        async def bad_gateway(request):
+            return web.Response(
+                status=502, text="<html>" + "x" * 100000, content_type="text/html"
+            )
+
+        app = web.Application()
+        app.router.add_post("/bad_request", bad_request)
+        app.router.add_post("/bad_gateway", bad_gateway)
+        async with TestServer(app) as server:
+            provider = APIProvider(
+                name="test_api_provider",
+                api_base_url=str(server.make_url("")),
+                max_retries=1,
+            )
+            try:
+                with self.assertRaisesRegex(Exception, "^invalid platform$"):
+                    await provider._async_make_api_request("bad_request")
+                with self.assertRaisesRegex(Exception, "^API request failed: 502$"):
+                    await provider._async_make_api_request("bad_gateway")
+            finally:
+                await provider.async_close()
+
+    async def test_error_message_read_from_chunked_body(self):
+        """测试分块、分多次到达的错误响应体完整读取后再解析 error 字段"""
+        from aiohttp import web
+        from aiohttp.test_utils import TestServer
+
+        async def bad_request(request):
+            response = web.StreamResponse(
+                status=400, headers={"Content-Type": "application/json"}
+            )
+            response.enable_chunked_encoding()
+            await response.prepare(request)
+            await response.write(b'{"error": "invalid')
+            await asyncio.sleep(0.05)
+            await response.write(b' platform"}')
+            await response.write_eof()
+            return response
+
+        app = web.Application()
+        app.router.add_post("/bad_request", bad_request)
+        async with TestServer(app) as server:
+            provider = APIProvider(
+                name="test_api_provider",
+                api_base_url=str(server.make_url("")),
+                max_retries=1,
+            )
+            with self.assertRaisesRegex(Exception, "^invalid platform$"):
+                await provider._async_make_api_request("bad_request")
+
+    async def test_cancel_request_without_waiting(self):
+        """测试 wait=False 时本地立即取消，API 调用在后台完成"""
+        from aiohttp import web
+        from aiohttp.test_utils import TestServer
+
+        release = asyncio.Event()
+        received = []
+
+        async def cancel(request):
+            received.append(await request.json())
+            await release.wait()
+            return web.json_response({"success": True})
+
+        app = web.Application()
+        app.router.add_post("/v1/humanloop/cancel", cancel)
+        async with TestServer(app) as server:
+            provider = APIProvider(
+                name="test_api_provider", api_base_url=str(server.make_url(""))
+            )
+            provider._store_request(
+                conversation_id="conv",
+                request_id="req",
+                task_id="task",
+                loop_type=HumanLoopType.APPROVAL,
+                context={},
+                metadata={"platform": "wechat"},
+                timeout=None,
+            )
+            try:
+                self.assertTrue(
+                    await provider.async_cancel_request("conv", "req", wait=False)
+                )
+                self.assertEqual(
+                    provider._get_request("conv", "req")["status"],
+                    HumanLoopStatus.CANCELLED,
+                )
+                self.assertEqual(len(provider._pending_cancels), 1)
+
+                release.set()
+                await asyncio.gather(*provider._pending_cancels)
+                self.assertEqual(received[0]["request_id"], "req")
+                self.assertEqual(provider._pending_cancels, set())
+            finally:
+                await provider.async_close()
@@ -0,0 +1,182 @@
+import threading
+import time
+import unittest
+from email.mime.text import MIMEText
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import MagicMock, patch
+
+from pydantic import SecretStr
+
+from gohumanloop.core.interface import HumanLoopStatus, HumanLoopType
+
+try:
+    from gohumanloop.providers.email_provider import EmailProvider
+except ImportError:  # imapclient 未安装
+    EmailProvider = None
+
+requires_imapclient = unittest.skipIf(EmailProvider is None, "imapclient 未安装")
+
+
+def make_email(subject, sender="reviewer@example.com"):
+    """构造 RFC822 格式的邮件内容"""
+    msg = MIMEText("同意", "plain", "utf-8")
+    msg["Subject"] = subject
+    msg["From"] = sender
+    return msg.as_bytes()
+
+
+def make_provider():
+    return EmailProvider(
+        name="test_email_provider",
+        smtp_server="smtp.example.com",
+        smtp_port=465,
+        imap_server="imap.example.com",
+        imap_port=993,
+        username="bot@example.com",
+        password=SecretStr("password"),
+        check_interval=1,
+    )
+
+
+def mock_imap_client(mock_cls, supports_idle=True):
+    """返回 with IMAPClient(...) 中得到的客户端模拟对象"""
+    client = mock_cls.return_value.__enter__.return_value
+    client.has_capability.return_value = supports_idle
+    return client
+
+
+@requires_imapclient
+@patch("gohumanloop.providers.email_provider.IMAPClient")
+class TestEmailProviderFetch(unittest.TestCase):
+    """测试 EmailProvider 在单个 IMAP 连接上等待回复邮件"""
+
+    def setUp(self):
+        self.provider = make_provider()
+
+    def test_search_email_matches_subject_and_sender(self, mock_cls):
+        """测试只返回主题和发件人都匹配的未读邮件，并将其标记为已读"""
+        client = MagicMock()
+        client.search.return_value = [1, 2]
+        client.fetch.return_value = {
+            1: {b"RFC822": make_email("其他主题")},
+            2: {b"RFC822": make_email("Re: 审批请求")},
+        }
+
+        msg = self.provider._search_email(client, "审批请求", "reviewer@example.com")
+
+        self.assertIn("审批请求", self.provider._decode_email_header(msg["Subject"]))
+        client.set_flags.assert_called_once_with(2, [b"\\Seen"])
+
+    def test_idle_between_searches(self, mock_cls):
+        """测试服务器支持 IDLE 时在两次搜索之间等待新邮件通知"""
+        client = mock_imap_client(mock_cls)
+        client.search.side_effect = [[], [1]]
+        client.fetch.return_value = {1: {b"RFC822": make_email("Re: 审批请求")}}
+
+        msg = self.provider._fetch_emails_sync("审批请求", should_stop=lambda: False)
+
+        self.assertIsNotNone(msg)
+        self.assertEqual(mock_cls.call_count, 1)
+        client.idle.assert_called_once()
+        client.idle_check.assert_called_once_with(timeout=1)
+        client.idle_done.assert_called_once()
+
+    def test_sleep_without_idle(self, mock_cls):
+        """测试服务器不支持 IDLE 时按 check_interval 休眠后重新搜索"""
+        client = mock_imap_client(mock_cls, supports_idle=False)
+        client.search.side_effect = [[], [1]]
+        client.fetch.return_value = {1: {b"RFC822": make_email("Re: 审批请求")}}
+
+        with patch("gohumanloop.providers.email_provider.time.sleep") as sleep:
+            msg = self.provider._fetch_emails_sync(
+                "审批请求", should_stop=lambda: False
+            )
+
+        self.assertIsNotNone(msg)
+        sleep.assert_called_once_with(1)
+        client.idle.assert_not_called()
+
+    def test_stop_after_wait(self, mock_cls):
+        """测试等待结束后 should_stop 返回 True 时不再搜索，直接返回 None"""
+        client = mock_imap_client(mock_cls)
+        client.search.return_value = []
+
+        msg = self.provider._fetch_emails_sync(
+            "审批请求", should_stop=MagicMock(side_effect=[False, True])
+        )
+
+        self.assertIsNone(msg)
+        client.search.assert_called_once()
+        client.idle_done.assert_called_once()
+
+    def test_search_once_without_should_stop(self, mock_cls):
+        """测试未提供 should_stop 时只搜索一次"""
+        client = mock_imap_client(mock_cls)
+        client.search.return_value = []
+
+        self.assertIsNone(self.provider._fetch_emails_sync("审批请求"))
+        client.idle.assert_not_called()
+
+
+@requires_imapclient
+@patch("gohumanloop.providers.email_provider.IMAPClient")
+class TestEmailProviderCheckStop(IsolatedAsyncioTestCase):
+    """测试请求超时或取消后 IMAP 会话退出"""
+
+    def setUp(self):
+        self.provider = make_provider()
+        self.provider._store_request(
+            conversation_id="conv",
+            request_id="req",
+            task_id="task",
+            loop_type=HumanLoopType.APPROVAL,
+            context={},
+            metadata={},
+            timeout=None,
+        )
+        self.closed = threading.Event()
+
+    def mock_client(self, mock_cls):
+        client = mock_imap_client(mock_cls)
+        client.search.return_value = []
+        mock_cls.return_value.__exit__.side_effect = lambda *args: self.closed.set()
+        return client
+
+    async def test_cancel_stops_waiting(self, mock_cls):
+        """测试请求被取消后等待中的 IMAP 会话退出，不再发起新连接"""
+        client = self.mock_client(mock_cls)
+
+        def cancel_during_idle(timeout):
+            self.provider._get_request("conv", "req")[
+                "status"
+            ] = HumanLoopStatus.CANCELLED
+
+        client.idle_check.side_effect = cancel_during_idle
+
+        await self.provider._async_check_emails(
+            "conv", "req", "reviewer@example.com", "审批请求"
+        )
+
+        self.assertTrue(self.closed.is_set())
+        self.assertEqual(mock_cls.call_count, 1)
+        client.idle_done.assert_called_once()
+
+    async def test_timeout_stops_waiting(self, mock_cls):
+        """测试超时后请求标记为过期，执行器中的 IMAP 会话随后退出"""
+        client = self.mock_client(mock_cls)
+        client.idle_check.side_effect = lambda timeout: time.sleep(0.2)
+
+        await self.provider._async_check_emails_with_timeout(
+            "conv", "req", "reviewer@example.com", "审批请求", timeout=0.05
+        )
+
+        self.assertEqual(
+            self.provider._get_request("conv", "req")["status"],
+            HumanLoopStatus.EXPIRED,
+        )
+        self.assertTrue(self.closed.wait(timeout=5))
+        self.assertEqual(mock_cls.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
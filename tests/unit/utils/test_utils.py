@@ -7,8 +7,21 @@ from unittest.mock import patch
 from unittest import IsolatedAsyncioTestCase
 from pydantic import SecretStr
 
-from gohumanloop.utils.utils import run_async_safely, get_secret_from_env
+from gohumanloop.utils.utils import (
+    BackgroundEventLoop,
+    RESPONSE_ACCEPT,
+    deadline,
+    decode_response,
+    run_async_safely,
+    get_secret_from_env,
+    json_dumps,
+    json_loads,
+)
 from gohumanloop.utils.threadsafedict import ThreadSafeDict
+from gohumanloop.utils.context_formatter import (
+    generate_function_summary,
+    make_function_summary,
+)
 
 
 class TestRunAsyncSafely(unittest.TestCase):
@@ -42,6 +55,41 @@ class TestRunAsyncSafely(unittest.TestCase):
             self.assertEqual(result, 42)
 
 
+class TestBackgroundEventLoop(unittest.TestCase):
+    """测试后台事件循环"""
+
+    def test_run_reuses_single_thread(self):
+        """测试多次调用复用同一个后台线程"""
+
+        async def current_thread():
+            return threading.current_thread()
+
+        bg = BackgroundEventLoop()
+        try:
+            first = bg.run(current_thread())
+            second = bg.run(current_thread())
+            self.assertIs(first, second)
+            self.assertIsNot(first, threading.current_thread())
+        finally:
+            bg.close()
+        self.assertFalse(first.is_alive())
+
+    def test_run_from_running_loop(self):
+        """测试在已运行的事件循环中调用"""
+
+        async def sample_coro():
+            return 42
+
+        async def main():
+            return bg.run(sample_coro())
+
+        bg = BackgroundEventLoop()
+        try:
+            self.assertEqual(asyncio.run(main()), 42)
+        finally:
+            bg.close()
+
+
 class TestGetSecretFromEnv(unittest.TestCase):
     """测试环境变量获取和密钥处理功能"""
 
@@ -250,5 +298,70 @@ class TestThreadSafeDict(IsolatedAsyncioTestCase):
         self.assertEqual(await d.alen(), 0)
 
 
+class TestFunctionSummary(unittest.TestCase):
+    """测试函数说明生成功能"""
+
+    def test_make_function_summary_matches_generate(self):
+        """测试预生成模板与直接生成的结果一致"""
+
+        def calculate(a: int, b: float = 1.0) -> float:
+            """计算两个数的乘积"""
+            return a * b
+
+        for language in ("zh", "en"):
+            summary = make_function_summary(calculate, language=language)
+            self.assertEqual(
+                summary(3, b=2.5),
+                generate_function_summary(calculate, 3, language=language, b=2.5),
+            )
+            self.assertIn("calculate(*(3,), **{'b': 2.5})", summary(3, b=2.5))
+
+
+class TestJsonHelpers(unittest.TestCase):
+    """测试 JSON 序列化辅助函数"""
+
+    def test_round_trip(self):
+        """测试序列化与反序列化结果一致"""
+        payload = {"message": "审批", "data": [1, 2.5, None, True], "nested": {}}
+        encoded = json_dumps(payload)
+        self.assertIsInstance(encoded, str)
+        self.assertEqual(json_loads(encoded), payload)
+        self.assertEqual(json_loads(encoded.encode("utf-8")), payload)
+
+    def test_decode_response(self):
+        """测试按响应类型解码，未知类型按 JSON 处理"""
+        payload = {"success": True, "status": "pending"}
+        body = json_dumps(payload).encode("utf-8")
+        self.assertEqual(decode_response(body, "application/json"), payload)
+        self.assertEqual(decode_response(body, "text/plain"), payload)
+        self.assertIn("application/json", RESPONSE_ACCEPT)
+
+    def test_decode_msgpack_response(self):
+        """测试安装 msgspec 时解码 MessagePack 响应"""
+        try:
+            from msgspec import msgpack
+        except ImportError:
+            self.skipTest("msgspec 未安装")
+        self.assertTrue(RESPONSE_ACCEPT.startswith("application/msgpack"))
+        payload = {"success": True, "status": "approved"}
+        body = msgpack.encode(payload)
+        self.assertEqual(decode_response(body, "application/msgpack"), payload)
+
+
+class TestDeadline(IsolatedAsyncioTestCase):
+    """测试超时上下文管理器"""
+
+    async def test_deadline_expires(self):
+        """测试超时后抛出 TimeoutError"""
+        with self.assertRaises(asyncio.TimeoutError):
+            async with deadline(0.01):
+                await asyncio.sleep(1)
+
+    async def test_deadline_none_means_no_limit(self):
+        """测试 timeout 为 None 时不限制时间"""
+        async with deadline(None):
+            await asyncio.sleep(0.01)
+
+
 if __name__ == "__main__":
     unittest.main()